@@ -1,32 +1,508 @@
-from queue import Queue
+import argparse
+import itertools
+import threading
+import time
+import timeit
+from collections import deque
+from queue import Empty, Full, Queue
+
+from durable_queue import DurableQueue
+
+# Policies of RingBufferQueue.put() when the buffer is full
+POLICY_BLOCK = "block"              # wait until a consumer frees a slot
+POLICY_DROP_OLDEST = "drop_oldest"  # overwrite the oldest task
+POLICY_REJECT = "reject"            # raise queue.Full immediately
+
+
+class RingBufferQueue:
+    """
+    Thread-safe fixed-capacity FIFO queue on top of a preallocated list.
+
+    The buffer is allocated once, so memory never grows under a burst.
+    Size and peek are O(1), get_batch() drains many tasks under one lock
+    acquisition. The interface mirrors queue.Queue (put/get/qsize/empty/full),
+    so it can be used anywhere the standard queue is used.
+    """
+
+    def __init__(self, capacity: int, policy: str = POLICY_BLOCK):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if policy not in (POLICY_BLOCK, POLICY_DROP_OLDEST, POLICY_REJECT):
+            raise ValueError(f"Unknown policy: {policy}")
+
+        self.capacity = capacity
+        self.policy = policy
+        self._buffer = [None] * capacity
+        self._head = 0  # index of the oldest item
+        self._size = 0
+
+        # Number of tasks overwritten by the drop_oldest policy
+        self.dropped = 0
+
+        lock = threading.Lock()
+        self._not_empty = threading.Condition(lock)
+        self._not_full = threading.Condition(lock)
+
+    def put(self, item, timeout: float = None) -> None:
+        """
+        Adds an item to the tail of the queue. When the queue is full the
+        behaviour depends on the policy; with the block policy queue.Full is
+        raised if no slot was freed within `timeout` seconds.
+        """
+        with self._not_full:
+            if self._size == self.capacity:
+                if self.policy == POLICY_REJECT:
+                    raise Full
+                if self.policy == POLICY_DROP_OLDEST:
+                    self._buffer[self._head] = None
+                    self._head = (self._head + 1) % self.capacity
+                    self._size -= 1
+                    self.dropped += 1
+                elif not self._not_full.wait_for(lambda: self._size < self.capacity, timeout):
+                    raise Full
+
+            self._buffer[(self._head + self._size) % self.capacity] = item
+            self._size += 1
+            self._not_empty.notify()
+
+    def get(self, timeout: float = None):
+        """
+        Removes and returns the oldest item. Raises queue.Empty if nothing
+        arrived within `timeout` seconds (None - wait forever).
+        """
+        with self._not_empty:
+            if not self._size and not self._not_empty.wait_for(lambda: self._size, timeout):
+                raise Empty
+
+            item = self._buffer[self._head]
+            self._buffer[self._head] = None  # release the reference
+            self._head = (self._head + 1) % self.capacity
+            self._size -= 1
+            self._not_full.notify()
+            return item
+
+    def get_batch(self, n: int, timeout: float = None) -> list:
+        """
+        Removes and returns up to n oldest items in one lock acquisition.
+        Waits only for the first item; raises queue.Empty on timeout.
+        """
+        with self._not_empty:
+            if not self._size and not self._not_empty.wait_for(lambda: self._size, timeout):
+                raise Empty
+
+            count = min(n, self._size)
+            start = self._head
+            end = start + count
+
+            # Copy whole slices instead of item by item - one or two C-level copies
+            if end <= self.capacity:
+                items = self._buffer[start:end]
+                self._buffer[start:end] = [None] * count
+            else:
+                end -= self.capacity
+                items = self._buffer[start:] + self._buffer[:end]
+                self._buffer[start:] = [None] * (self.capacity - start)
+                self._buffer[:end] = [None] * end
+
+            self._head = end % self.capacity
+            self._size -= count
+            self._not_full.notify(count)
+            return items
+
+    def peek(self):
+        """Returns the oldest item without removing it (None if the queue is empty)."""
+        with self._not_empty:
+            return self._buffer[self._head] if self._size else None
+
+    def items(self, limit: int) -> list:
+        """Returns up to `limit` oldest items without removing them."""
+        with self._not_empty:
+            return [self._buffer[(self._head + i) % self.capacity]
+                    for i in range(min(limit, self._size))]
+
+    def qsize(self) -> int:
+        return self._size
+
+    def empty(self) -> bool:
+        return self._size == 0
+
+    def full(self) -> bool:
+        return self._size == self.capacity
+
+
+# Max number of tasks the interactive queue can hold
+TASK_QUEUE_CAPACITY: int = 1000
+
+# How many tasks show_queue_state() lists
+SHOW_LIMIT: int = 10
 
 # Creating a task queue
-task_queue: Queue = Queue()
+task_queue: RingBufferQueue = RingBufferQueue(TASK_QUEUE_CAPACITY, POLICY_REJECT)
 
 # Counter for incoming tasks
 tasks_counter: int = 0
 
+def make_item(task: str) -> tuple:
+    """
+    Queue item shared by the interactive and the processing modes: the task and
+    its wall-clock enqueue time, which stays meaningful after a restart of a
+    durable queue (a perf_counter() value doesn't).
+    """
+    return task, time.time()
+
+def unpack_item(item) -> tuple:
+    """
+    Returns (task, enqueue time) of a queue item. A plain task string left in
+    a journal by an older version has no enqueue time (None).
+    """
+    if isinstance(item, tuple) and len(item) == 2:
+        return item
+    return str(item), None
+
+def task_number(task: str) -> int:
+    """Returns N of a "Task #N" name, 0 for any other name."""
+    _, _, number = task.rpartition("#")
+    return int(number) if number.isdigit() else 0
+
 def generate_request() -> None:
     global tasks_counter
     tasks_counter += 1
     task: str = f"Task #{tasks_counter}"
-    task_queue.put(task)
+    try:
+        task_queue.put(make_item(task))
+    except Full:
+        print(f"The queue is full! {task} was rejected.")
+        return
     print(f"{task} was added to the queue.")
 
 def show_queue_state() -> None:
-    print(f"Current tasks in queue ({task_queue.qsize()}):")
-    for item in list(task_queue.queue):
-        print(f" - {item}")
+    size = task_queue.qsize()
+    print(f"Current tasks in queue ({size}):")
+    for item in task_queue.items(SHOW_LIMIT):
+        print(f" - {unpack_item(item)[0]}")
+    if size > SHOW_LIMIT:
+        print(f" ... and {size - SHOW_LIMIT} more")
 
 def process_request() -> None:
     if not task_queue.empty():
-        task: str = task_queue.get()
+        task, _ = unpack_item(task_queue.get())
         print(f"Processing {task}")
     else:
         print("Nothing to process. The queue is empty!")
 
-def main() -> None:
+def percentile(sorted_values: list, p: float) -> float:
+    """
+    Returns the p-th percentile (0-100) of an already sorted list
+    using the nearest-rank method.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * p // 100))  # ceil without floats
+    return sorted_values[int(rank) - 1]
+
+
+class TaskProcessor:
+    """
+    Multi-worker processing engine around a task queue.
+
+    Producer threads generate tasks at a configurable rate, a pool of worker
+    threads consumes them. Every task is stored in the queue together with
+    its enqueue timestamp, so the time spent waiting in the queue and the
+    time spent processing can be measured separately.
+    """
+
+    def __init__(self, workers: int = 4, producers: int = 1, rate: float = 1000.0,
+                 service_time: float = 0.001, queue=None, batch: int = 1):
+        """
+        Args:
+            workers (int): Number of consumer threads.
+            producers (int): Number of producer threads.
+            rate (float): Total number of tasks generated per second (0 - as fast as possible).
+            service_time (float): Simulated processing time of one task in seconds.
+            queue: Queue-like object with put() and get(timeout=...). Defaults to queue.Queue.
+            batch (int): Tasks taken per get_batch() call (requires RingBufferQueue), 1 - use get().
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if producers < 1:
+            raise ValueError("producers must be at least 1")
+
+        self.workers = workers
+        self.producers = producers
+        self.rate = rate
+        self.service_time = service_time
+        self.queue = queue if queue is not None else Queue()
+        self.batch = batch
+
+        # Set when all producers have finished - workers exit once the queue is drained
+        self._producers_done = threading.Event()
+        self._reset()
+
+    def _reset(self) -> None:
+        """Clears the state of the previous run, so every run() is measured on its own."""
+        self._producers_done.clear()
+
+        # itertools.count is advanced atomically under the GIL, so all
+        # producers can share it without an extra lock
+        self._task_ids = itertools.count(1)
+
+        # Per-worker metrics (each worker writes only its own slot - no locking needed)
+        self._waits = [[] for _ in range(self.workers)]
+        self._busy = [0.0] * self.workers
+        self._processed = [0] * self.workers
+        self._rejected = [0] * self.producers
+
+    def _produce(self, producer_id: int, tasks_limit: int, deadline: float) -> None:
+        """Generates tasks at rate / producers per second until the limit or deadline."""
+        interval = self.producers / self.rate if self.rate > 0 else 0.0
+        next_at = time.perf_counter()
+        produced = 0
+
+        while produced < tasks_limit:
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+
+            if interval:
+                # Keep a fixed schedule, so a slow iteration doesn't lower the rate
+                if next_at > now:
+                    time.sleep(next_at - now)
+                next_at += interval
+
+            task = f"Task #{next(self._task_ids)}"
+            try:
+                self.queue.put(make_item(task))
+            except Full:
+                self._rejected[producer_id] += 1
+            produced += 1
+
+    def _consume(self, worker_id: int) -> None:
+        """Takes tasks from the queue until producers are done and the queue is drained."""
+        waits = self._waits[worker_id]
+        busy = 0.0
+        processed = 0
+
+        while True:
+            try:
+                if self.batch > 1:
+                    items = self.queue.get_batch(self.batch, timeout=0.1)
+                else:
+                    items = (self.queue.get(timeout=0.1),)
+            except Empty:
+                # Producers don't add anything after the event is set,
+                # so an empty queue at this point means all work is done
+                if self._producers_done.is_set():
+                    break
+                continue
+
+            for item in items:
+                _, enqueued_at = unpack_item(item)
+                if enqueued_at is not None:
+                    waits.append(time.time() - enqueued_at)
+                started_at = time.perf_counter()
+
+                # Simulated processing of the task
+                if self.service_time:
+                    time.sleep(self.service_time)
+
+                busy += time.perf_counter() - started_at
+                processed += 1
+
+        self._busy[worker_id] = busy
+        self._processed[worker_id] = processed
+
+    def run(self, tasks: int = 10000, duration: float = float("inf")) -> dict:
+        """
+        Runs producers and workers until `tasks` tasks were generated (split
+        between producers) or `duration` seconds passed, then drains the queue.
+
+        Returns:
+            dict: Collected metrics (see report()).
+        """
+        self._reset()
+
+        per_producer = [tasks // self.producers + (1 if i < tasks % self.producers else 0)
+                        for i in range(self.producers)]
+
+        started_at = time.perf_counter()
+        deadline = started_at + duration
+
+        worker_threads = [threading.Thread(target=self._consume, args=(i,), daemon=True)
+                          for i in range(self.workers)]
+        producer_threads = [threading.Thread(target=self._produce, args=(i, limit, deadline), daemon=True)
+                            for i, limit in enumerate(per_producer)]
+
+        for thread in worker_threads + producer_threads:
+            thread.start()
+
+        for thread in producer_threads:
+            thread.join()
+
+        self._producers_done.set()
+
+        for thread in worker_threads:
+            thread.join()
+
+        elapsed = time.perf_counter() - started_at
+
+        waits = sorted(itertools.chain.from_iterable(self._waits))
+        processed = sum(self._processed)
+
+        return {
+            "workers": self.workers,
+            "producers": self.producers,
+            "processed": processed,
+            "rejected": sum(self._rejected),
+            "dropped": getattr(self.queue, "dropped", 0),
+            "elapsed": elapsed,
+            "throughput": processed / elapsed if elapsed else 0.0,
+            "wait_p50": percentile(waits, 50),
+            "wait_p99": percentile(waits, 99),
+            "utilisation": sum(self._busy) / (self.workers * elapsed) if elapsed else 0.0,
+            "per_worker": list(zip(self._processed, self._busy)),
+        }
+
+
+def report(metrics: dict) -> None:
+    """Prints the metrics collected by TaskProcessor.run()."""
+    print("-" * 40)
+    print(f"Workers / producers:   {metrics['workers']} / {metrics['producers']}")
+    print(f"Tasks processed:       {metrics['processed']}")
+    print(f"Rejected / dropped:    {metrics['rejected']} / {metrics['dropped']}")
+    print(f"Elapsed time:          {metrics['elapsed']:.3f} s")
+    print(f"Throughput:            {metrics['throughput']:.1f} tasks/s")
+    print(f"Queue wait p50 / p99:  {metrics['wait_p50'] * 1000:.3f} / {metrics['wait_p99'] * 1000:.3f} ms")
+    print(f"Worker utilisation:    {metrics['utilisation'] * 100:.1f} %")
+    for i, (processed, busy) in enumerate(metrics["per_worker"]):
+        print(f"  worker {i}: {processed} tasks, busy {busy:.3f} s")
+    print("-" * 40)
+
+
+def benchmark_queues(items: int = 100_000, batch: int = 100) -> None:
+    """
+    Single-threaded comparison of queue.Queue, collections.deque and
+    RingBufferQueue: fill the queue with `items` tasks, then drain it.
+    """
+    def fill_and_drain_queue():
+        q = Queue()
+        for i in range(items):
+            q.put(i)
+        for _ in range(items):
+            q.get()
+
+    def fill_and_drain_deque():
+        q = deque()
+        for i in range(items):
+            q.append(i)
+        for _ in range(items):
+            q.popleft()
+
+    def fill_and_drain_ring():
+        q = RingBufferQueue(items)
+        for i in range(items):
+            q.put(i)
+        for _ in range(items):
+            q.get()
+
+    def fill_and_drain_ring_batch():
+        q = RingBufferQueue(items)
+        for i in range(items):
+            q.put(i)
+        while not q.empty():
+            q.get_batch(batch)
+
+    candidates = [
+        ("queue.Queue", fill_and_drain_queue),
+        ("collections.deque", fill_and_drain_deque),
+        ("RingBufferQueue", fill_and_drain_ring),
+        (f"RingBuffer batch={batch}", fill_and_drain_ring_batch),
+    ]
+
+    print(f"{'Queue':<25} | {'Items':<10} | {'Time (seconds)':<15}")
+    print("-" * 55)
+    for name, func in candidates:
+        exec_time = min(timeit.repeat(func, number=1, repeat=3))
+        print(f"{name:<25} | {items:<10} | {exec_time:.6f}")
+
+
+def benchmark_durable_queue(directory: str, items: int = 500_000) -> None:
+    """
+    Measures enqueue and dequeue rates of DurableQueue with group commit.
+    """
+    queue = DurableQueue(directory)
+    backlog = queue.qsize()
+
+    started_at = time.perf_counter()
+    for i in range(items):
+        queue.put(make_item(f"Task #{i + 1}"))
+    queue.commit()
+    enqueue_time = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    for _ in range(items + backlog):
+        queue.get()
+    queue.commit()
+    dequeue_time = time.perf_counter() - started_at
+
+    queue.close()
+
+    print(f"{'Operation':<10} | {'Items':<10} | {'Time (seconds)':<15} | {'Items/s':<12}")
+    print("-" * 55)
+    print(f"{'Enqueue':<10} | {items:<10} | {enqueue_time:<15.6f} | {items / enqueue_time:<12.0f}")
+    print(f"{'Dequeue':<10} | {items + backlog:<10} | {dequeue_time:<15.6f} | "
+          f"{(items + backlog) / dequeue_time:<12.0f}")
+
+
+def parse_arguments():
+    """
+    Parses command-line arguments.
+    Without --bench the interactive mode is started.
+    """
+    parser = argparse.ArgumentParser(description="Task queue processor.")
+
+    parser.add_argument("--bench-queues", action="store_true",
+                        help="Compare queue.Queue, collections.deque and RingBufferQueue")
+    parser.add_argument("--bench-durable", action="store_true",
+                        help="Measure enqueue/dequeue rates of the durable queue in --durable folder")
+    parser.add_argument("--bench", action="store_true",
+                        help="Non-interactive mode: run producers and a worker pool and report metrics")
+    parser.add_argument("--workers", type=int, default=4, help="Number of worker threads")
+    parser.add_argument("--producers", type=int, default=1, help="Number of producer threads")
+    parser.add_argument("--rate", type=float, default=1000.0,
+                        help="Total tasks generated per second (0 - unlimited)")
+    parser.add_argument("--tasks", type=int, default=10000, help="Total number of tasks to generate")
+    parser.add_argument("--duration", type=float, default=float("inf"),
+                        help="Stop generating after this many seconds")
+    parser.add_argument("--service-time", type=float, default=0.001,
+                        help="Simulated processing time of one task in seconds")
+    parser.add_argument("--capacity", type=int, default=0,
+                        help="Use a RingBufferQueue of this capacity (0 - unbounded queue.Queue)")
+    parser.add_argument("--policy", default=POLICY_BLOCK,
+                        choices=[POLICY_BLOCK, POLICY_DROP_OLDEST, POLICY_REJECT],
+                        help="What to do when the ring buffer is full")
+    parser.add_argument("--batch", type=int, default=1,
+                        help="Tasks taken by a worker at once (requires --capacity)")
+    parser.add_argument("--durable", metavar="FOLDER",
+                        help="Keep the queue in an append-only journal in this folder (survives restarts)")
+
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.producers < 1:
+        parser.error("--producers must be at least 1")
+    if args.batch < 1:
+        parser.error("--batch must be at least 1")
+    # Batches are taken with RingBufferQueue.get_batch() - the other queues don't have it
+    if args.batch > 1 and (not args.capacity or args.durable):
+        parser.error("--batch requires --capacity (and can't be used with --durable)")
+    return args
+
+
+def run_interactive() -> None:
     print("Welcome to the Task Queue Processor! \nLet's start by adding some tasks.")
+    if not task_queue.empty():
+        print(f"Recovered {task_queue.qsize()} tasks from the previous run.")
+        show_queue_state()
     for _ in range(3):
         generate_request()
 
@@ -46,6 +522,48 @@ def main() -> None:
         else:
             print("Invalid action! Please choose 'a', 'p', or 'q'.")
 
+def main() -> None:
+    args = parse_arguments()
+
+    if args.bench_queues:
+        benchmark_queues()
+        return
+
+    if args.bench_durable:
+        benchmark_durable_queue(args.durable or "queue_journal")
+        return
+
+    if not args.bench:
+        if args.durable:
+            # Every interactive action is committed to disk immediately
+            global task_queue, tasks_counter
+            task_queue = DurableQueue(args.durable, sync_every=1)
+            # Continue the numbering of the previous runs, so task names don't repeat
+            last_item = task_queue.last_item()
+            if last_item is not None:
+                tasks_counter = task_number(unpack_item(last_item)[0])
+        try:
+            run_interactive()
+        finally:
+            if args.durable:
+                task_queue.close()
+        return
+
+    if args.durable:
+        queue = DurableQueue(args.durable)
+    elif args.capacity:
+        queue = RingBufferQueue(args.capacity, args.policy)
+    else:
+        queue = None
+    processor = TaskProcessor(workers=args.workers, producers=args.producers,
+                              rate=args.rate, service_time=args.service_time,
+                              queue=queue, batch=args.batch)
+    print(f"Running {args.tasks} tasks at {args.rate or 'unlimited'} tasks/s...")
+    report(processor.run(tasks=args.tasks, duration=args.duration))
+
+    if isinstance(queue, DurableQueue):
+        queue.close()
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,5 +1,12 @@
+import argparse
+import mmap
+import os
+import timeit
 from collections import deque
 
+# Bytes read from each end of a buffer at once in the streaming mode
+CHUNK_SIZE: int = 64 * 1024
+
 
 def check_palindrome(text) -> bool:
     """
@@ -22,7 +29,224 @@ def check_palindrome(text) -> bool:
     # If the loop finishes without mismatches - it is a palindrome
     return True
 
+def _clean(text: str) -> list:
+    """Normalises text exactly like check_palindrome() does."""
+    return [char.lower() for char in text if char.isalnum()]
+
+def check_palindrome_buffer(buffer, chunk_size: int = CHUNK_SIZE) -> bool:
+    """
+    Checks UTF-8 encoded bytes (bytes, bytearray, mmap) for being a palindrome
+    reading chunks from the head and from the tail at the same time.
+    Only two chunks are decoded at any moment, so memory stays constant
+    regardless of the input size. The normalisation matches check_palindrome().
+    """
+    left, right = 0, len(buffer)
+
+    # Cleaned characters of the current head chunk (in order) and of the
+    # current tail chunk (reversed), with read positions
+    head, head_pos = [], 0
+    tail, tail_pos = [], 0
+
+    # Keep a gap of two max-length UTF-8 characters, so that stepping over
+    # continuation bytes can never make the head and tail chunks overlap
+    while right - left > 2 * chunk_size + 8:
+        if head_pos == len(head):
+            end = left + chunk_size
+            # Don't split a multibyte character: step over continuation bytes
+            while buffer[end] & 0xC0 == 0x80:
+                end += 1
+            head, head_pos = _clean(bytes(buffer[left:end]).decode("utf-8")), 0
+            left = end
+
+        if tail_pos == len(tail):
+            start = right - chunk_size
+            while buffer[start] & 0xC0 == 0x80:
+                start -= 1
+            tail, tail_pos = _clean(bytes(buffer[start:right]).decode("utf-8"))[::-1], 0
+            right = start
+
+        # Compare as many characters as both chunks have
+        while head_pos < len(head) and tail_pos < len(tail):
+            if head[head_pos] != tail[tail_pos]:
+                return False
+            head_pos += 1
+            tail_pos += 1
+
+    # The ends met: check the unread middle together with the leftovers
+    rest = head[head_pos:] + _clean(bytes(buffer[left:right]).decode("utf-8")) + tail[tail_pos:][::-1]
+    return rest == rest[::-1]
+
+def check_palindrome_file(path: str, chunk_size: int = CHUNK_SIZE) -> bool:
+    """
+    Checks a UTF-8 text file of any size through mmap,
+    see check_palindrome_buffer().
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return True
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            return check_palindrome_buffer(m, chunk_size)
+
+def _clean_with_positions(text: str) -> tuple:
+    """
+    Normalises text like check_palindrome() and remembers where each
+    cleaned character came from in the original text.
+    """
+    units, positions = [], []
+    for i, char in enumerate(text):
+        if char.isalnum():
+            units.append(char.lower())
+            positions.append(i)
+    return units, positions
+
+def manacher(units: list) -> list:
+    """
+    Manacher's algorithm. Works on the sequence interleaved with separators,
+    so odd and even palindromes are handled the same way.
+    Time Complexity: O(n)
+
+    Returns:
+        list: radii[i] - length of the longest palindrome centred at
+        position i of the interleaved sequence (#u0#u1#...#).
+    """
+    # None can never be equal to a cleaned character, so it works as a separator
+    t = [None] * (2 * len(units) + 1)
+    t[1::2] = units
+
+    n = len(t)
+    radii = [0] * n
+    center = right = 0
+
+    for i in range(n):
+        # Reuse the mirrored radius inside the rightmost known palindrome
+        r = min(right - i, radii[2 * center - i]) if i < right else 0
+
+        # Expand past the known part
+        while i - r - 1 >= 0 and i + r + 1 < n and t[i - r - 1] == t[i + r + 1]:
+            r += 1
+
+        radii[i] = r
+        if i + r > right:
+            center, right = i, i + r
+
+    return radii
+
+def palindrome_stats(text: str) -> tuple:
+    """
+    Finds the longest palindromic substring and counts all palindromic
+    substrings of the text, normalised like in check_palindrome().
+    Time Complexity: O(n)
+
+    Returns:
+        tuple: (longest palindrome as a slice of the original text, count)
+    """
+    units, positions = _clean_with_positions(text)
+    if not units:
+        return "", 0
+
+    radii = manacher(units)
+
+    # A radius r in the interleaved sequence covers (r + 1) // 2 palindromes
+    count = sum((r + 1) // 2 for r in radii)
+
+    best = max(range(len(radii)), key=radii.__getitem__)
+    start = (best - radii[best]) // 2
+    end = start + radii[best] - 1
+
+    return text[positions[start]:positions[end] + 1], count
+
+def palindrome_stats_batch(texts) -> list:
+    """Runs palindrome_stats() over an iterable of strings."""
+    return [palindrome_stats(text) for text in texts]
+
+def palindrome_stats_naive(text: str) -> tuple:
+    """
+    Same result as palindrome_stats(), using expansion around every center.
+    Time Complexity: O(n^2) - used as the benchmark baseline.
+    """
+    units, positions = _clean_with_positions(text)
+    if not units:
+        return "", 0
+
+    n = len(units)
+    count = 0
+    best_start, best_len = 0, 1
+
+    for center in range(2 * n - 1):
+        left, right = center // 2, (center + 1) // 2
+        while left >= 0 and right < n and units[left] == units[right]:
+            count += 1
+            left -= 1
+            right += 1
+        length = right - left - 1
+        if length > best_len:
+            best_start, best_len = left + 1, length
+
+    return text[positions[best_start]:positions[best_start + best_len - 1] + 1], count
+
+def run_benchmark() -> None:
+    """
+    Compares Manacher's algorithm with the expand-around-center approach on
+    the Ukrainian text samples and on a worst case for expansion (one repeated letter).
+    """
+    samples_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                  "..", "algo-hw-05", "text_samples")
+    inputs = []
+    for name in ("text-1-ukr.txt", "text-2-ukr.txt"):
+        path = os.path.join(samples_folder, name)
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                inputs.append((name, f.read()))
+    for size in (1000, 2000, 4000):
+        inputs.append((f"'а' * {size}", "а" * size))
+
+    print(f"{'Input':<16} | {'Algorithm':<20} | {'Time (seconds)':<15} | {'Longest':<8} | {'Count':<10}")
+    print("-" * 80)
+    for name, text in inputs:
+        for algo_name, func in (("Manacher", palindrome_stats), ("Expand around center", palindrome_stats_naive)):
+            exec_time = timeit.timeit(lambda: func(text), number=1)
+            longest, count = func(text)
+            print(f"{name:<16} | {algo_name:<20} | {exec_time:<15.6f} | {len(longest):<8} | {count:<10}")
+        print("-" * 80)
+
+def parse_arguments():
+    """
+    Parses command-line arguments.
+    Without arguments the list of popular palindromes is checked.
+    """
+    parser = argparse.ArgumentParser(description="Palindrome checker.")
+
+    parser.add_argument("files", nargs="*", help="UTF-8 text files to check in the streaming mode")
+    parser.add_argument("--stats", action="store_true",
+                        help="Report the longest palindromic substring and the count of palindromes in the files")
+    parser.add_argument("--bench", action="store_true",
+                        help="Compare Manacher's algorithm with expansion around center")
+
+    return parser.parse_args()
+
 def main() -> None:
+    args = parse_arguments()
+
+    if args.bench:
+        run_benchmark()
+        return
+
+    if args.stats:
+        texts = []
+        for path in args.files:
+            with open(path, "r", encoding="utf-8") as f:
+                texts.append(f.read())
+        for path, (longest, count) in zip(args.files, palindrome_stats_batch(texts)):
+            print(f"{path}: {count} palindromic substrings, the longest: '{longest}'")
+        return
+
+    # Streaming mode: check the files given on the command line
+    if args.files:
+        for path in args.files:
+            checkmark = "✅" if check_palindrome_file(path) else "❌"
+            print(f"{checkmark} {path}")
+        return
+
     popular_palindromes = [
         # English palindromes
         "Madam, I'm Adam",
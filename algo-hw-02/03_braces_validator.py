@@ -1,4 +1,27 @@
+import argparse
+import os
+import re
+import time
+from array import array
 from collections import deque
+from multiprocessing import Pool
+
+OPENING_BRACES = "([{"
+CLOSING_BRACES = ")]}"
+
+# Any brace character - everything else is skipped by the regex engine in C
+BRACES_PATTERN_STR = re.compile(r"[()\[\]{}]")
+BRACES_PATTERN_BYTES = re.compile(rb"[()\[\]{}]")
+
+# Brace character code -> (is opening, brace kind 0..2)
+BRACE_CODES = {ord(c): (True, i) for i, c in enumerate(OPENING_BRACES)}
+BRACE_CODES.update({ord(c): (False, i) for i, c in enumerate(CLOSING_BRACES)})
+
+# Bytes read at once by validate_braces_file()
+CHUNK_SIZE: int = 1024 * 1024
+
+# Max bytes summarised by one task of validate_braces_parallel()
+PARALLEL_CHUNK_SIZE: int = 64 * 1024 * 1024
 
 
 def validate_braces(s: str) -> bool:
@@ -38,7 +61,282 @@ def validate_braces(s: str) -> bool:
     # The braces are balanced if the stack is completely empty at the end.
     return len(stack) == 0
 
+class BraceValidator:
+    """
+    Incremental brace validator for streamed input.
+
+    Input is passed in chunks with feed(), then close() is called at the end.
+    Chunks may be str or bytes (bytes are scanned directly, without decoding),
+    the offset is counted in the units of the chunks (chars or bytes).
+    The stack is a bytearray of brace kinds (0, 1, 2) - one byte per open brace.
+
+    After the first error the validator stops and remembers:
+        error_offset (int): Offset of the offending brace (or the input length at the end).
+        expected (str | None): Closing brace that was expected (None - nothing was open).
+        found (str | None): Brace that was found (None - the input ended).
+    """
+
+    def __init__(self):
+        self._stack = bytearray()
+        self.offset = 0
+        self.error_offset = None
+        self.expected = None
+        self.found = None
+
+    @property
+    def failed(self) -> bool:
+        return self.error_offset is not None
+
+    def _fail(self, offset: int, found) -> None:
+        self.error_offset = offset
+        self.expected = CLOSING_BRACES[self._stack[-1]] if self._stack else None
+        self.found = found
+
+    def feed(self, chunk) -> bool:
+        """
+        Validates the next chunk of input.
+
+        Returns:
+            bool: False once an error has been found, True otherwise.
+        """
+        if self.failed:
+            return False
+
+        pattern = BRACES_PATTERN_BYTES if isinstance(chunk, (bytes, bytearray, memoryview)) else BRACES_PATTERN_STR
+        stack = self._stack
+
+        for match in pattern.finditer(chunk):
+            char = match.group()
+            is_opening, kind = BRACE_CODES[char[0] if isinstance(char, bytes) else ord(char)]
+
+            if is_opening:
+                stack.append(kind)
+            elif not stack or stack[-1] != kind:
+                self._fail(self.offset + match.start(), CLOSING_BRACES[kind])
+                return False
+            else:
+                stack.pop()
+
+        self.offset += len(chunk)
+        return True
+
+    def close(self) -> bool:
+        """
+        Finishes the input.
+
+        Returns:
+            bool: True if all braces were balanced and correctly nested.
+        """
+        if not self.failed and self._stack:
+            self._fail(self.offset, None)
+        return not self.failed
+
+    def describe_error(self) -> str:
+        if not self.failed:
+            return "No errors"
+        found = f"'{self.found}'" if self.found else "end of input"
+        expected = f"'{self.expected}'" if self.expected else "no closing brace"
+        return f"Offset {self.error_offset}: expected {expected}, found {found}"
+
+
+def validate_braces_file(path: str, chunk_size: int = CHUNK_SIZE) -> BraceValidator:
+    """
+    Validates braces of a file of any size, reading it in binary chunks.
+
+    Returns:
+        BraceValidator: Closed validator with the result and the error details.
+    """
+    validator = BraceValidator()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            if not validator.feed(chunk):
+                break
+    validator.close()
+    return validator
+
+class BraceSummary:
+    """
+    What a part of the input leaves unresolved once all braces matched
+    inside it are removed:
+        closers (bytearray) + closer_offsets (array): Unmatched closing braces
+            (kinds and absolute offsets) - they must be matched by openers to the left.
+        openers (bytearray): Unmatched opening braces (kinds) - they must be
+            matched by closers to the right.
+        error (tuple | None): First nesting error inside the part
+            (offset, expected, found) - nothing after it matters.
+
+    Summaries of adjacent parts combine associatively with combine().
+    """
+
+    def __init__(self):
+        self.closers = bytearray()
+        self.closer_offsets = array("q")
+        self.openers = bytearray()
+        self.error = None
+
+    def combine(self, right: "BraceSummary") -> "BraceSummary":
+        """Merges the summary of the part that directly follows this one (in place)."""
+        if self.error is not None:
+            return self
+
+        openers = self.openers
+        for i, kind in enumerate(right.closers):
+            if not openers:
+                # Nothing left to match on this side - still unresolved
+                self.closers += right.closers[i:]
+                self.closer_offsets.extend(right.closer_offsets[i:])
+                break
+            if openers[-1] != kind:
+                self.error = (right.closer_offsets[i], CLOSING_BRACES[openers[-1]], CLOSING_BRACES[kind])
+                return self
+            openers.pop()
+
+        openers += right.openers
+        self.error = right.error
+        return self
+
+    def to_validator(self, length: int) -> BraceValidator:
+        """Turns the summary of the whole input into a closed BraceValidator."""
+        validator = BraceValidator()
+        validator.offset = length
+
+        if self.closers:
+            # An unmatched closer at the global level is the first error
+            validator.error_offset = self.closer_offsets[0]
+            validator.found = CLOSING_BRACES[self.closers[0]]
+        elif self.error is not None:
+            validator.error_offset, validator.expected, validator.found = self.error
+        elif self.openers:
+            validator.error_offset = length
+            validator.expected = CLOSING_BRACES[self.openers[-1]]
+
+        return validator
+
+
+def summarize_chunk(task: tuple) -> BraceSummary:
+    """
+    Process pool task: reads one chunk of a file and summarises its braces.
+
+    Args:
+        task (tuple): (file path, start offset, chunk size).
+    """
+    path, start, size = task
+    with open(path, "rb") as f:
+        f.seek(start)
+        chunk = f.read(size)
+
+    summary = BraceSummary()
+    openers = summary.openers
+
+    for match in BRACES_PATTERN_BYTES.finditer(chunk):
+        is_opening, kind = BRACE_CODES[match.group()[0]]
+
+        if is_opening:
+            openers.append(kind)
+        elif not openers:
+            summary.closers.append(kind)
+            summary.closer_offsets.append(start + match.start())
+        elif openers[-1] != kind:
+            summary.error = (start + match.start(), CLOSING_BRACES[openers[-1]], CLOSING_BRACES[kind])
+            break
+        else:
+            openers.pop()
+
+    return summary
+
+def validate_braces_parallel(path: str, workers: int = None,
+                             chunk_size: int = None) -> BraceValidator:
+    """
+    Validates braces of a large file in parallel: chunks are summarised in
+    a process pool and the summaries are reduced in file order.
+    The result is the same as validate_braces_file() gives.
+
+    Returns:
+        BraceValidator: Closed validator with the result and the error details.
+    """
+    length = os.path.getsize(path)
+    if chunk_size is None:
+        # A few chunks per process for load balancing, but not too many tiny ones
+        chunk_size = max(CHUNK_SIZE, min(PARALLEL_CHUNK_SIZE, length // ((workers or os.cpu_count() or 1) * 4) + 1))
+    tasks = [(path, start, chunk_size) for start in range(0, length, chunk_size)]
+
+    result = BraceSummary()
+    with Pool(workers) as pool:
+        # imap keeps the order of chunks, so summaries can be folded as they arrive
+        for summary in pool.imap(summarize_chunk, tasks):
+            result.combine(summary)
+
+    return result.to_validator(length)
+
+def generate_braces_file(path: str, size: int) -> None:
+    """Writes a valid JSON-like file of about `size` bytes with nested braces."""
+    block = ('{"items": [' + ", ".join(f'{{"id": {i}, "tags": ["a", "b"], "pos": [{i}, ({i})]}}'
+                                        for i in range(1000)) + "]}\n").encode()
+    repeat = max(1, size // (len(block) * 64))
+    with open(path, "wb") as f:
+        f.write(b"[")
+        for _ in range(64):
+            f.write(block * repeat)
+        f.write(b"]")
+
+def run_benchmark(path: str, size_mb: int) -> None:
+    """Sequential vs parallel validation of a generated file over 1..N processes."""
+    if not os.path.exists(path):
+        print(f"Generating {size_mb} MB test file {path}...")
+        generate_braces_file(path, size_mb * 1024 * 1024)
+
+    started_at = time.perf_counter()
+    sequential = validate_braces_file(path)
+    sequential_time = time.perf_counter() - started_at
+
+    print(f"{'Mode':<20} | {'Time (seconds)':<15} | {'Speedup':<8} | {'Result'}")
+    print("-" * 70)
+    print(f"{'Sequential':<20} | {sequential_time:<15.3f} | {1.0:<8.2f} | {sequential.describe_error()}")
+
+    for workers in range(1, (os.cpu_count() or 1) + 1):
+        started_at = time.perf_counter()
+        parallel = validate_braces_parallel(path, workers)
+        parallel_time = time.perf_counter() - started_at
+
+        same = (parallel.error_offset, parallel.expected, parallel.found) == \
+               (sequential.error_offset, sequential.expected, sequential.found)
+        print(f"{f'Parallel x{workers}':<20} | {parallel_time:<15.3f} | {sequential_time / parallel_time:<8.2f} | "
+              f"{parallel.describe_error()}{'' if same else ' (MISMATCH!)'}")
+
+def parse_arguments():
+    """
+    Parses command-line arguments.
+    Without arguments the built-in test strings are validated.
+    """
+    parser = argparse.ArgumentParser(description="Brace validator.")
+
+    parser.add_argument("files", nargs="*", help="Files to validate in the streaming mode")
+    parser.add_argument("--parallel", action="store_true", help="Validate the files using a process pool")
+    parser.add_argument("--workers", type=int, default=None, help="Number of processes (default - all cores)")
+    parser.add_argument("--bench", metavar="FILE",
+                        help="Compare sequential and parallel validation on FILE (generated if missing)")
+    parser.add_argument("--size-mb", type=int, default=1024, help="Size of the generated benchmark file")
+
+    return parser.parse_args()
+
 def main() -> None:
+    args = parse_arguments()
+
+    if args.bench:
+        run_benchmark(args.bench, args.size_mb)
+        return
+
+    # Streaming mode: validate the files given on the command line
+    if args.files:
+        for path in args.files:
+            if args.parallel:
+                validator = validate_braces_parallel(path, args.workers)
+            else:
+                validator = validate_braces_file(path)
+            checkmark = "✅" if not validator.failed else "❌"
+            print(f"{checkmark} {path}: {validator.describe_error()}")
+        return
+
     test_strings = [
         "()",          # Valid
         "([])",        # Valid
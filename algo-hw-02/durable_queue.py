@@ -0,0 +1,348 @@
+import mmap
+import os
+import pickle
+import struct
+import threading
+import time
+import zlib
+from queue import Empty
+
+# Record header: payload length + CRC32 of the payload
+RECORD_HEADER = struct.Struct("<II")
+
+# Consumer position: segment id + byte offset inside the segment
+CURSOR = struct.Struct("<QQ")
+
+SEGMENT_SUFFIX = ".seg"
+CURSOR_FILE = "cursor"
+
+
+def segment_name(segment_id: int) -> str:
+    return f"{segment_id:012d}{SEGMENT_SUFFIX}"
+
+
+class DurableQueue:
+    """
+    Persistent FIFO queue on top of segmented append-only journal files.
+
+    - Writes go through a buffered file and are made durable in groups:
+      one flush + fsync per `sync_every` operations or `sync_interval` seconds
+      (group commit), so a single fsync is amortised over many enqueues. A timer
+      commits the last operations of a burst, when no further ones arrive.
+    - Reads go through mmap of the segment files, so the backlog can be much
+      larger than RAM - the OS pages the journal in and out as needed.
+    - The consumer position (cursor) is persisted together with the group
+      commit. After a crash every task that was not yet consumed at the last
+      commit is delivered again (at-least-once delivery).
+    - Recovery truncates a torn record at the tail of the last segment.
+    - Compaction deletes segments whose records have all been consumed.
+
+    The interface mirrors queue.Queue (put/get/qsize/empty), so it can be used
+    in place of the in-memory task queue.
+    """
+
+    def __init__(self, directory: str, segment_size: int = 64 * 1024 * 1024,
+                 sync_every: int = 1000, sync_interval: float = 0.05):
+        """
+        Args:
+            directory (str): Folder with the journal segments (created if missing).
+            segment_size (int): Size in bytes after which a new segment is started.
+            sync_every (int): Max number of operations between two fsyncs.
+            sync_interval (float): Max number of seconds between two fsyncs.
+        """
+        self.directory = directory
+        self.segment_size = segment_size
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+
+        self._pending = 0  # operations since the last commit
+        self._last_sync = time.monotonic()
+        self._timer = None  # commits pending operations after sync_interval
+        self._size = 0
+
+        # Reader state: mapped segment, read offset and mapped length
+        self._read_map = None
+        self._read_limit = 0
+
+        self._recover()
+
+    # ------------------------------------------
+    # Recovery
+    # ------------------------------------------
+
+    def _segment_path(self, segment_id: int) -> str:
+        return os.path.join(self.directory, segment_name(segment_id))
+
+    def _list_segments(self) -> list:
+        return sorted(int(name[:-len(SEGMENT_SUFFIX)]) for name in os.listdir(self.directory)
+                      if name.endswith(SEGMENT_SUFFIX))
+
+    def _load_cursor(self, segments: list) -> tuple:
+        try:
+            with open(os.path.join(self.directory, CURSOR_FILE), "rb") as f:
+                segment_id, offset = CURSOR.unpack(f.read(CURSOR.size))
+        except (FileNotFoundError, struct.error):
+            return (segments[0] if segments else 1), 0
+
+        # The segment under the cursor may have been compacted away after a crash
+        if segments and segment_id < segments[0]:
+            return segments[0], 0
+        return segment_id, offset
+
+    def _scan_segment(self, segment_id: int, offset: int, verify: bool) -> tuple:
+        """
+        Walks the records of a segment starting at `offset`.
+
+        Returns:
+            tuple: (number of records, offset right after the last valid record)
+        """
+        path = self._segment_path(segment_id)
+        file_size = os.path.getsize(path)
+        if file_size <= offset:
+            return 0, offset
+
+        count = 0
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            while offset + RECORD_HEADER.size <= file_size:
+                length, crc = RECORD_HEADER.unpack_from(m, offset)
+                end = offset + RECORD_HEADER.size + length
+                if end > file_size:
+                    break
+                if verify and zlib.crc32(m[offset + RECORD_HEADER.size:end]) != crc:
+                    break
+                offset = end
+                count += 1
+        return count, offset
+
+    def _recover(self) -> None:
+        """Restores the cursor, counts unread records and repairs a torn tail."""
+        segments = self._list_segments()
+        self._read_segment, self._read_offset = self._load_cursor(segments)
+
+        if not segments:
+            segments = [self._read_segment]
+            open(self._segment_path(self._read_segment), "wb").close()
+
+        for segment_id in segments:
+            if segment_id < self._read_segment:
+                continue
+            is_last = segment_id == segments[-1]
+            start = self._read_offset if segment_id == self._read_segment else 0
+            count, valid_end = self._scan_segment(segment_id, start, verify=is_last)
+            self._size += count
+
+            if is_last and valid_end < os.path.getsize(self._segment_path(segment_id)):
+                # Torn write from a crash - drop the incomplete record
+                os.truncate(self._segment_path(segment_id), valid_end)
+
+        self._write_segment = segments[-1]
+        self._open_writer()
+        self._delete_consumed_segments()
+
+    # ------------------------------------------
+    # Writing
+    # ------------------------------------------
+
+    def _open_writer(self) -> None:
+        path = self._segment_path(self._write_segment)
+        self._file = open(path, "ab", buffering=1024 * 1024)
+        self._write_offset = self._file.tell()
+
+    def _roll_segment(self) -> None:
+        """Seals the active segment and starts a new one."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._write_segment += 1
+        self._open_writer()
+
+    def put(self, item) -> None:
+        """Appends an item to the journal. The item must be picklable."""
+        payload = pickle.dumps(item, pickle.HIGHEST_PROTOCOL)
+        record = RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+        with self._lock:
+            if self._write_offset >= self.segment_size:
+                self._roll_segment()
+
+            self._file.write(record)
+            self._write_offset += len(record)
+            self._size += 1
+            self._not_empty.notify()
+            self._after_operation()
+
+    # ------------------------------------------
+    # Reading
+    # ------------------------------------------
+
+    def _map_read_segment(self) -> None:
+        """(Re)maps the segment under the cursor, covering everything written so far."""
+        if self._read_map is not None:
+            self._read_map.close()
+            self._read_map = None
+            self._read_limit = 0
+
+        if self._read_segment == self._write_segment:
+            # Make buffered records of the active segment visible to the reader
+            self._file.flush()
+
+        path = self._segment_path(self._read_segment)
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size:
+                self._read_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                self._read_limit = size
+
+    def _next_record_offset(self) -> int:
+        """Positions the reader on the next unread record (requires _size > 0)."""
+        while self._read_offset >= self._read_limit:
+            if (self._read_offset >= os.path.getsize(self._segment_path(self._read_segment))
+                    and self._read_segment < self._write_segment):
+                # Segment fully consumed - continue with the next one
+                self._read_segment += 1
+                self._read_offset = 0
+            self._map_read_segment()
+        return self._read_offset
+
+    def _read_payload(self, offset: int) -> tuple:
+        length, _ = RECORD_HEADER.unpack_from(self._read_map, offset)
+        start = offset + RECORD_HEADER.size
+        return self._read_map[start:start + length], start + length
+
+    def get(self, timeout: float = None):
+        """
+        Removes and returns the oldest item. Raises queue.Empty if nothing
+        arrived within `timeout` seconds (None - wait forever).
+        """
+        with self._not_empty:
+            if not self._size and not self._not_empty.wait_for(lambda: self._size, timeout):
+                raise Empty
+
+            payload, self._read_offset = self._read_payload(self._next_record_offset())
+            self._size -= 1
+            self._after_operation()
+
+        return pickle.loads(payload)
+
+    def items(self, limit: int) -> list:
+        """Returns up to `limit` oldest items without removing them."""
+        with self._lock:
+            limit = min(limit, self._size)
+            self._file.flush()
+
+            payloads = []
+            segment_id, offset = self._read_segment, self._read_offset
+            while len(payloads) < limit:
+                # Separate short-lived mapping, so the reader state is left untouched
+                with open(self._segment_path(segment_id), "rb") as f:
+                    if os.fstat(f.fileno()).st_size > offset:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                            while len(payloads) < limit and offset < len(m):
+                                length, _ = RECORD_HEADER.unpack_from(m, offset)
+                                start = offset + RECORD_HEADER.size
+                                payloads.append(m[start:start + length])
+                                offset = start + length
+                segment_id, offset = segment_id + 1, 0
+
+        return [pickle.loads(payload) for payload in payloads]
+
+    def peek(self):
+        """Returns the oldest item without removing it (None if the queue is empty)."""
+        items = self.items(1)
+        return items[0] if items else None
+
+    def last_item(self):
+        """
+        Returns the newest item still kept in the journal, consumed or not
+        (None if the journal is empty), e.g. to continue a numbering after restart.
+        """
+        with self._lock:
+            self._file.flush()
+
+            for segment_id in reversed(self._list_segments()):
+                with open(self._segment_path(segment_id), "rb") as f:
+                    if not os.fstat(f.fileno()).st_size:
+                        continue
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                        offset = last = 0
+                        while offset < len(m):
+                            length, _ = RECORD_HEADER.unpack_from(m, offset)
+                            last = offset
+                            offset += RECORD_HEADER.size + length
+                        length, _ = RECORD_HEADER.unpack_from(m, last)
+                        start = last + RECORD_HEADER.size
+                        return pickle.loads(m[start:start + length])
+        return None
+
+    def qsize(self) -> int:
+        return self._size
+
+    def empty(self) -> bool:
+        return self._size == 0
+
+    # ------------------------------------------
+    # Group commit and compaction
+    # ------------------------------------------
+
+    def _after_operation(self) -> None:
+        self._pending += 1
+        if (self._pending >= self.sync_every
+                or time.monotonic() - self._last_sync >= self.sync_interval):
+            self._commit()
+        elif self._timer is None:
+            # At most one timer is armed, so a burst of operations starts one thread per interval
+            self._timer = threading.Timer(self.sync_interval, self._timed_commit)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _timed_commit(self) -> None:
+        with self._lock:
+            self._timer = None
+            if self._pending and not self._file.closed:
+                self._commit()
+
+    def _commit(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+        # Atomically replace the cursor file (write + fsync + rename)
+        tmp_path = os.path.join(self.directory, CURSOR_FILE + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(CURSOR.pack(self._read_segment, self._read_offset))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, os.path.join(self.directory, CURSOR_FILE))
+
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+        self._delete_consumed_segments()
+
+    def _delete_consumed_segments(self) -> None:
+        """Compaction: removes segments that lie entirely before the persisted cursor."""
+        for segment_id in self._list_segments():
+            if segment_id >= self._read_segment:
+                break
+            os.remove(self._segment_path(segment_id))
+
+    def commit(self) -> None:
+        """Forces a group commit of all pending operations."""
+        with self._lock:
+            self._commit()
+
+    def close(self) -> None:
+        """Commits pending operations and releases the files."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._commit()
+            if self._read_map is not None:
+                self._read_map.close()
+                self._read_map = None
+            self._file.close()
@@ -1,6 +1,39 @@
 import argparse
+import contextlib
+import errno
+import hashlib
+import os
 import shutil
+import sqlite3
+import statistics
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from queue import Queue
+
+# Size of the copy job queue per worker in the parallel mode
+JOBS_PER_WORKER: int = 64
+
+# Extension directories that already exist - each one is created only once
+created_dirs: set = set()
+
+# ioctl request that clones file extents (reflink) on Linux (btrfs, XFS, ...)
+FICLONE: int = 0x40049409
+
+# Errors meaning "this transfer method isn't possible here" - auto mode then tries the next one
+UNSUPPORTED_ERRORS = {errno.EXDEV, errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.ENOSYS, errno.EBADF}
+
+# Strategies auto mode found unsupported - they aren't tried again
+unsupported_strategies: set = set()
+
+# Bytes hashed from the head and from the tail of a file by the cheap partial hash
+PARTIAL_HASH_BLOCK: int = 64 * 1024
+
+# Name of the duplicates report written to the output folder in dedup mode
+DEDUP_REPORT: str = "duplicates_report.txt"
 
 
 def parse_arguments():
@@ -16,32 +49,169 @@ def parse_arguments():
     # Argument for the destination directory (optional)
     parser.add_argument("output_folder", nargs="?", default="dist", help="Path to the destination directory")
 
-    return parser.parse_args()
+    # Number of copy threads (1 - copy serially while walking)
+    parser.add_argument("-w", "--workers", type=int, default=1, help="Number of parallel copy workers")
+
+    # How the file content gets to the destination
+    parser.add_argument("-t", "--transfer", default="copy", choices=list(TRANSFER_STRATEGIES) + ["auto"],
+                        help="copy - shutil.copy2, kernel - copy_file_range/sendfile, reflink - "
+                             "copy-on-write clone, hardlink/symlink - link to the source, "
+                             "auto - the fastest of reflink/kernel/copy that works")
+
+    # Incremental mode: copy only new or changed files, tracked in a manifest in the output folder
+    parser.add_argument("--sync", action="store_true", help="Copy only files changed since the previous run")
+    parser.add_argument("--prune", action="store_true",
+                        help="With --sync, delete copies of files that were removed from the source")
+    parser.add_argument("--hash", action="store_true",
+                        help="With --sync, compare content hashes of files whose size or mtime changed")
+
+    # Deduplication: every distinct content is stored once
+    parser.add_argument("--dedup", choices=["report", "hardlink", "symlink"],
+                        help="Copy identical files once; other copies are only listed in the report "
+                             "or linked to the stored one")
+
+    # Benchmark of the directory walkers on a synthetic tree generated in source_folder
+    parser.add_argument("--bench-walk", type=int, metavar="FILES",
+                        help="Compare the directory walkers on a synthetic tree with this many files")
+
+    args = parser.parse_args()
+    if args.dedup and args.sync:
+        parser.error("--dedup can't be combined with --sync")
+    return args
+
+def destination_path(file_path: Path, output_folder: Path) -> Path:
+    """Returns where a file is copied to: <output_folder>/<extension>/<file name>."""
+    # Get the file extension (without the dot). If no extension, use 'no_extension'
+    extension = file_path.suffix[1:] if file_path.suffix else "no_extension"
+    return output_folder / extension / file_path.name
+
+def _write_replacing(destination: Path, write) -> None:
+    """
+    Calls write(temporary_path) for a new file in the destination folder and then
+    renames it onto the destination. An existing destination - possibly a hard or
+    symbolic link to a source file left by a previous link run - is replaced, never
+    written through, and a failed transfer leaves it as it was.
+    """
+    fd, temporary = tempfile.mkstemp(prefix=f".{destination.name}.", suffix=".part", dir=destination.parent)
+    os.close(fd)
+    try:
+        write(Path(temporary))
+        os.replace(temporary, destination)
+    except BaseException:
+        # Only the file created here is removed
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(temporary)
+        raise
+
+def transfer_copy(source: Path, destination: Path) -> None:
+    """Streams the content through user space and copies metadata (shutil.copy2)."""
+    _write_replacing(destination, lambda temporary: shutil.copy2(source, temporary))
 
-def copy_file(file_path: Path, output_folder: Path) -> None:
+def _kernel_copy(source: Path, temporary: Path) -> None:
+    with open(source, "rb") as src, open(temporary, "wb") as dst:
+        remaining = os.fstat(src.fileno()).st_size
+        offset = 0
+        while remaining > 0:
+            if hasattr(os, "copy_file_range"):
+                sent = os.copy_file_range(src.fileno(), dst.fileno(), remaining, offset, offset)
+            else:
+                sent = os.sendfile(dst.fileno(), src.fileno(), offset, remaining)
+            if sent == 0:
+                break
+            offset += sent
+            remaining -= sent
+    shutil.copystat(source, temporary)
+
+def transfer_kernel(source: Path, destination: Path) -> None:
+    """Copies the content inside the kernel with os.copy_file_range (or os.sendfile)."""
+    _write_replacing(destination, lambda temporary: _kernel_copy(source, temporary))
+
+def _reflink(source: Path, temporary: Path) -> None:
+    import fcntl  # POSIX only
+
+    with open(source, "rb") as src, open(temporary, "wb") as dst:
+        fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+    shutil.copystat(source, temporary)
+
+def transfer_reflink(source: Path, destination: Path) -> None:
+    """Shares the data blocks copy-on-write (FICLONE) - no data is copied at all."""
+    _write_replacing(destination, lambda temporary: _reflink(source, temporary))
+
+def _replace_with_link(destination: Path, make_link) -> None:
+    """Creates a link in place of an existing destination file, like a copy would overwrite it."""
+    try:
+        make_link()
+    except FileExistsError:
+        destination.unlink()
+        make_link()
+
+def transfer_hardlink(source: Path, destination: Path) -> None:
+    """Creates a hard link (same filesystem only) - the copy shares the content with the source."""
+    _replace_with_link(destination, lambda: os.link(source, destination))
+
+def transfer_symlink(source: Path, destination: Path) -> None:
+    """Creates a symbolic link to the absolute source path."""
+    _replace_with_link(destination, lambda: os.symlink(os.path.abspath(source), destination))
+
+TRANSFER_STRATEGIES = {
+    "copy": transfer_copy,
+    "kernel": transfer_kernel,
+    "reflink": transfer_reflink,
+    "hardlink": transfer_hardlink,
+    "symlink": transfer_symlink,
+}
+
+# Order in which auto mode tries the strategies (links change semantics, so they are not used)
+AUTO_ORDER = ["reflink", "kernel", "copy"]
+
+def transfer_auto(source: Path, destination: Path) -> None:
+    """Uses the fastest strategy that works, falling back on 'not supported' errors."""
+    for name in AUTO_ORDER:
+        if name in unsupported_strategies:
+            continue
+        try:
+            TRANSFER_STRATEGIES[name](source, destination)
+            return
+        except (OSError, ImportError, AttributeError) as e:
+            if name == AUTO_ORDER[-1] or isinstance(e, OSError) and e.errno not in UNSUPPORTED_ERRORS:
+                raise
+            unsupported_strategies.add(name)
+
+def make_parent_folder(destination: Path) -> None:
+    """Creates the folder of a destination file, once per folder (see created_dirs)."""
+    target_dir = destination.parent
+    if target_dir not in created_dirs:
+        target_dir.mkdir(parents=True, exist_ok=True)
+        created_dirs.add(target_dir)
+
+def copy_file(file_path: Path, output_folder: Path, transfer: str = "copy", destination_file: Path = None):
     """
     Copies a file to the destination folder, sorted by extension.
 
     Args:
         file_path (Path): Path to the source file.
         output_folder (Path): Path to the root destination directory.
+        transfer (str): Name of the transfer strategy (see TRANSFER_STRATEGIES) or "auto".
+        destination_file (Path): Explicit destination (default - see destination_path()).
+
+    Returns:
+        int | None: Number of bytes copied, None if the copy failed.
     """
     try:
-        # Get the file extension (without the dot). If no extension, use 'no_extension'
-        extension = file_path.suffix[1:] if file_path.suffix else "no_extension"
-
-        # Create a target directory path based on the extension
-        target_dir = output_folder / extension
-
-        # Create the directory if it doesn't exist
-        target_dir.mkdir(parents=True, exist_ok=True)
-
         # Define the full destination path including filename
-        destination_file = target_dir / file_path.name
+        if destination_file is None:
+            destination_file = destination_path(file_path, output_folder)
+
+        # Create the directory if it doesn't exist (once per extension)
+        make_parent_folder(destination_file)
 
         # Copy the file with metadata
-        shutil.copy2(file_path, destination_file)
+        if transfer == "auto":
+            transfer_auto(file_path, destination_file)
+        else:
+            TRANSFER_STRATEGIES[transfer](file_path, destination_file)
         print(f"Copied: {file_path} -> {destination_file}")
+        return destination_file.stat().st_size
 
     except PermissionError:
         print(f"Error: Permission denied for file {file_path}")
@@ -50,13 +220,94 @@ def copy_file(file_path: Path, output_folder: Path) -> None:
     except Exception as e:
         print(f"Unexpected error copying {file_path}: {e}")
 
-def read_folder(path: Path, output_folder: Path) -> None:
+def read_folder(path: Path, output_folder: Path, handle_file=copy_file) -> bool:
+    """
+    Iterates through the directory tree with os.scandir and an explicit
+    stack, so deep trees can't hit the recursion limit. File types come from
+    the cached DirEntry data, and the output folder is identified once by
+    its (device, inode) instead of resolving every subdirectory.
+
+    Args:
+        path (Path): Root directory to iterate.
+        output_folder (Path): Destination root folder.
+        handle_file: Called as handle_file(file_path, output_folder) for every file.
+
+    Returns:
+        bool: True if every directory was read, False if the root is missing
+              or some directory could not be read (the walk is incomplete).
+    """
+    # Check if the path actually exists and is a directory
+    if not path.is_dir():
+        print(f"Error: The path {path} does not exist.")
+        return False
+
+    # Identify the output folder, so it is skipped even if it is located inside
+    # the source folder. Callers that copy create it before the walk (see
+    # prepare_output); a folder that doesn't exist can't be walked into
+    try:
+        output_stat = output_folder.stat()
+        output_id = (output_stat.st_dev, output_stat.st_ino)
+    except FileNotFoundError:
+        output_id = None
+    except OSError as e:
+        print(f"OS Error accessing {output_folder}: {e}")
+        return False
+
+    complete = True
+    stack = [os.fspath(path)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Skip the output folder if it is created inside the source folder.
+                        # inode() is cached on POSIX, stat() is only called on a match or a symlink
+                        if output_id is not None and (entry.is_symlink() or entry.inode() == output_id[1]):
+                            entry_stat = entry.stat()
+                            if (entry_stat.st_dev, entry_stat.st_ino) == output_id:
+                                continue
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        # If item is a file, perform the copy operation
+                        handle_file(Path(entry.path), output_folder)
+
+        except PermissionError:
+            print(f"Error: Permission denied for directory {directory}")
+            complete = False
+        except OSError as e:
+            print(f"OS Error accessing {directory}: {e}")
+            complete = False
+        except Exception as e:
+            print(f"Unexpected error reading {directory}: {e}")
+            complete = False
+
+    return complete
+
+def prepare_output(output_folder: Path) -> bool:
+    """
+    Creates the output folder before a copying walk, so read_folder() can
+    recognise it even when it is inside the source folder.
+
+    Returns:
+        bool: False if the folder could not be created.
+    """
+    try:
+        output_folder.mkdir(parents=True, exist_ok=True)
+        return True
+    except OSError as e:
+        print(f"OS Error creating {output_folder}: {e}")
+        return False
+
+def read_folder_recursive(path: Path, output_folder: Path, handle_file=copy_file) -> None:
     """
     Recursively iterates through the directory.
+    The original walker, kept as the benchmark baseline.
 
     Args:
         path (Path): Current directory path to iterate.
         output_folder (Path): Destination root folder.
+        handle_file: Called as handle_file(file_path, output_folder) for every file.
     """
     try:
         # Check if the path actually exists and is a directory
@@ -71,10 +322,10 @@ def read_folder(path: Path, output_folder: Path) -> None:
                 # Skip the output folder if it is created inside the source folder
                 if item.resolve() == output_folder.resolve():
                     continue
-                read_folder(item, output_folder)
+                read_folder_recursive(item, output_folder, handle_file)
             elif item.is_file():
                 # If item is a file, perform the copy operation
-                copy_file(item, output_folder)
+                handle_file(item, output_folder)
 
     except PermissionError:
         print(f"Error: Permission denied for directory {path}")
@@ -83,6 +334,393 @@ def read_folder(path: Path, output_folder: Path) -> None:
     except Exception as e:
         print(f"Unexpected error reading {path}: {e}")
 
+def file_hash(file_path: Path) -> str:
+    """Returns the SHA-256 hex digest of a file's content."""
+    with open(file_path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+class Manifest:
+    """
+    Index of the files copied by previous runs, stored as an SQLite database
+    in the output folder: source path, size, mtime, optional content hash
+    and the destination path.
+
+    The whole index is loaded into a dict at start, so deciding whether a
+    file changed costs one stat() and one dict lookup. New records are
+    collected in memory and written in a single transaction by save().
+    """
+
+    FILE_NAME = ".organizer_manifest.sqlite"
+
+    def __init__(self, output_folder: Path, use_hash: bool = False):
+        self.use_hash = use_hash
+        self.unchanged = 0
+
+        output_folder.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(output_folder / self.FILE_NAME)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS files (
+                source TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                hash TEXT,
+                destination TEXT NOT NULL
+            )""")
+        self._db.execute("CREATE INDEX IF NOT EXISTS files_destination ON files (destination)")
+
+        # source -> (size, mtime_ns, hash). Entries are removed as the walk
+        # sees them, so whatever is left at the end was deleted from the source
+        self._entries = {source: (size, mtime_ns, content_hash) for source, size, mtime_ns, content_hash
+                         in self._db.execute("SELECT source, size, mtime_ns, hash FROM files")}
+
+        # Records to write - list.append is atomic, so copy threads can add to it.
+        # Files that were only touched (same hash) get just their metadata updated
+        self._pending = []
+        self._touched = []
+
+    def needs_copy(self, file_path: Path):
+        """
+        Checks a source file against the manifest. Called from the walker thread only.
+
+        Returns:
+            tuple | None: Metadata (size, mtime_ns, hash) to record after the copy,
+            None if the file is unchanged.
+        """
+        stat = file_path.stat()
+        old = self._entries.pop(str(file_path), None)
+        meta = (stat.st_size, stat.st_mtime_ns, None)
+
+        if old is None:
+            return (*meta[:2], file_hash(file_path)) if self.use_hash else meta
+
+        if old[:2] == meta[:2]:
+            self.unchanged += 1
+            return None
+
+        if self.use_hash:
+            meta = (*meta[:2], file_hash(file_path))
+            if old[2] == meta[2]:
+                # Only touched - update the metadata without copying
+                self._touched.append((*meta, str(file_path)))
+                self.unchanged += 1
+                return None
+
+        return meta
+
+    def record(self, file_path: Path, meta: tuple, destination: Path) -> None:
+        """Remembers a copied file."""
+        self._pending.append((str(file_path), *meta, str(destination)))
+
+    def save(self, prune: bool = False) -> int:
+        """
+        Writes the collected records. With prune=True also deletes the copies
+        of files that no longer exist in the source. An entry the walk did not
+        see is pruned only if its source file is really gone, so a file the
+        walk could not reach keeps its copy. Callers must not prune at all
+        after an incomplete walk (see copy_files()).
+
+        Returns:
+            int: Number of pruned files.
+        """
+        pruned = 0
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO files (source, size, mtime_ns, hash, destination) VALUES (?, ?, ?, ?, ?)",
+                self._pending)
+            self._db.executemany("UPDATE files SET size = ?, mtime_ns = ?, hash = ? WHERE source = ?",
+                                 self._touched)
+            self._pending = []
+            self._touched = []
+
+            if prune:
+                for source in self._entries:
+                    if os.path.exists(source):
+                        continue
+                    (destination,) = self._db.execute(
+                        "SELECT destination FROM files WHERE source = ?", (source,)).fetchone()
+                    self._db.execute("DELETE FROM files WHERE source = ?", (source,))
+
+                    # Another source may have been copied to the same place - keep the file then
+                    if self._db.execute("SELECT 1 FROM files WHERE destination = ?", (destination,)).fetchone():
+                        continue
+                    try:
+                        os.remove(destination)
+                        print(f"Pruned: {destination}")
+                        pruned += 1
+                    except FileNotFoundError:
+                        pass
+                    except OSError as e:
+                        print(f"OS Error pruning {destination}: {e}")
+                self._entries = {}
+
+        return pruned
+
+    def close(self) -> None:
+        self._db.close()
+
+
+def partial_hash(file_path: Path) -> str:
+    """Cheap pre-filter hash: only the first and the last PARTIAL_HASH_BLOCK bytes."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        digest.update(f.read(PARTIAL_HASH_BLOCK))
+        if f.seek(0, os.SEEK_END) > 2 * PARTIAL_HASH_BLOCK:
+            f.seek(-PARTIAL_HASH_BLOCK, os.SEEK_END)
+            digest.update(f.read(PARTIAL_HASH_BLOCK))
+    return digest.hexdigest()
+
+def _try_hash(hash_function, file_path: Path):
+    try:
+        return hash_function(file_path)
+    except OSError as e:
+        print(f"OS Error reading {file_path}: {e}")
+        return None
+
+def split_by_hash(groups: list, hash_function, map_function=map) -> tuple:
+    """
+    Splits every group of candidate duplicates by the hash of its files,
+    computed with map_function (the thread pool's map or the built-in one).
+
+    Returns:
+        tuple: (groups of 2+ files with equal hashes, files left alone in their group)
+    """
+    files = [file_path for group in groups for file_path in group]
+    hashes = iter(map_function(lambda file_path: _try_hash(hash_function, file_path), files))
+
+    duplicates, unique = [], []
+    for group in groups:
+        by_hash = defaultdict(list)
+        for file_path in group:
+            content_hash = next(hashes)
+            if content_hash is None:
+                # Unreadable - let copy_file() report the error
+                unique.append(file_path)
+            else:
+                by_hash[content_hash].append(file_path)
+
+        for same in by_hash.values():
+            if len(same) > 1:
+                duplicates.append(same)
+            else:
+                unique.append(same[0])
+
+    return duplicates, unique
+
+def unique_destination(file_path: Path, output_folder: Path, taken: set) -> Path:
+    """
+    Like destination_path(), but adds a " (n)" suffix if the name is already
+    taken in this run, so different files with the same name don't overwrite each other.
+    """
+    destination = destination_path(file_path, output_folder)
+    n = 0
+    while destination in taken:
+        n += 1
+        destination = destination.with_name(f"{file_path.stem} ({n}){file_path.suffix}")
+    taken.add(destination)
+    return destination
+
+def dedup_files(source_path: Path, output_path: Path, workers: int = 1, transfer: str = "copy",
+                mode: str = "report") -> tuple:
+    """
+    Copies every distinct file content once.
+
+    Files are grouped by size first - a file with a unique size can't have
+    a duplicate and is never hashed. Groups of equal size are split by a cheap
+    partial hash (head and tail blocks), and only the remaining candidates get
+    a full SHA-256 - unless they fit in one PARTIAL_HASH_BLOCK, then the partial
+    hash already covered the whole content. With more than one worker hashing
+    and copying run in a thread pool.
+
+    Duplicates are listed in the report in the output folder and, depending
+    on the mode, hard- or symlinked to the stored copy under their own name.
+
+    Returns:
+        tuple: (files copied, bytes copied, duplicates found, bytes not copied)
+    """
+    by_size = defaultdict(list)
+
+    def collect(file_path: Path, _) -> None:
+        try:
+            by_size[file_path.stat().st_size].append(file_path)
+        except OSError as e:
+            print(f"OS Error accessing {file_path}: {e}")
+
+    read_folder(source_path, output_path, collect)
+
+    unique = [group[0] for group in by_size.values() if len(group) == 1]
+    small = [group for size, group in by_size.items() if len(group) > 1 and size <= PARTIAL_HASH_BLOCK]
+    candidates = [group for size, group in by_size.items() if len(group) > 1 and size > PARTIAL_HASH_BLOCK]
+
+    with ThreadPoolExecutor(workers) if workers > 1 else contextlib.nullcontext() as pool:
+        run = pool.map if pool is not None else map
+
+        # The partial hash of a file no larger than one block is its full hash
+        duplicate_groups, alone = split_by_hash(small, partial_hash, run)
+        unique += alone
+        candidates, alone = split_by_hash(candidates, partial_hash, run)
+        unique += alone
+        duplicates, alone = split_by_hash(candidates, file_hash, run)
+        duplicate_groups += duplicates
+        unique += alone
+
+        # (stored file, its destination, duplicates) for every distinct content
+        taken = set()
+        contents = [(file_path, []) for file_path in unique] + [(group[0], group[1:]) for group in duplicate_groups]
+        plan = [(file_path, unique_destination(file_path, output_path, taken), duplicates)
+                for file_path, duplicates in contents]
+
+        copied = list(run(lambda item: copy_file(item[0], output_path, transfer, item[1]), plan))
+
+    files = sum(1 for size in copied if size is not None)
+    size = sum(size for size in copied if size is not None)
+    duplicates_found = saved = 0
+
+    output_path.mkdir(parents=True, exist_ok=True)
+    with open(output_path / DEDUP_REPORT, "w", encoding="utf-8") as report:
+        for (file_path, destination, duplicates), stored_size in zip(plan, copied):
+            if not duplicates or stored_size is None:
+                continue
+
+            report.write(f"{stored_size} bytes, stored as {destination} (from {file_path})\n")
+            for duplicate in duplicates:
+                duplicates_found += 1
+                saved += stored_size
+
+                link = None
+                if mode != "report" and destination_path(duplicate, output_path) != destination:
+                    link = unique_destination(duplicate, output_path, taken)
+                    try:
+                        # A duplicate with another extension goes to a folder nothing was copied to yet
+                        make_parent_folder(link)
+                        TRANSFER_STRATEGIES[mode](destination, link)
+                        print(f"Linked: {duplicate} -> {link}")
+                    except OSError as e:
+                        print(f"OS Error linking {duplicate}: {e}")
+                        link = None
+
+                report.write(f"    duplicate: {duplicate}" + (f" -> {link}" if link else "") + "\n")
+
+    return files, size, duplicates_found, saved
+
+def copy_files(source_path: Path, output_path: Path, workers: int = 1, manifest: Manifest = None,
+               transfer: str = "copy") -> tuple:
+    """
+    Copies all files from the source tree, sorted by extension.
+
+    With more than one worker the directory walk only produces copy jobs
+    into a bounded queue, and a pool of threads consumes them, so several
+    copies are in flight at once. Errors are handled per file by copy_file().
+    With a manifest only new or changed files are copied.
+
+    Returns:
+        tuple: (number of files copied, number of bytes copied,
+                True if the whole source tree was read)
+    """
+    if manifest is not None:
+        # Manifest keys are absolute paths, so reruns from another cwd still match
+        source_path = Path(os.path.abspath(source_path))
+
+    if not prepare_output(output_path):
+        return 0, 0, False
+
+    # Per-worker totals [files, bytes] - every thread updates only its own slot
+    totals = [[0, 0] for _ in range(max(workers, 1))]
+
+    def copy_and_count(file_path: Path, meta, slot: list) -> None:
+        copied = copy_file(file_path, output_path, transfer)
+        if copied is not None:
+            slot[0] += 1
+            slot[1] += copied
+            if manifest is not None:
+                manifest.record(file_path, meta, destination_path(file_path, output_path))
+
+    def for_changed_files(submit):
+        """Wraps a job handler, so that it is called only for files that need copying."""
+        def handle_file(file_path: Path, _) -> None:
+            if manifest is None:
+                submit(file_path, None)
+                return
+            try:
+                meta = manifest.needs_copy(file_path)
+            except OSError as e:
+                print(f"OS Error accessing {file_path}: {e}")
+                return
+            if meta is not None:
+                submit(file_path, meta)
+        return handle_file
+
+    if workers <= 1:
+        complete = read_folder(source_path, output_path,
+                               for_changed_files(lambda file_path, meta: copy_and_count(file_path, meta, totals[0])))
+        return totals[0][0], totals[0][1], complete
+
+    # Bounded queue: the walker waits if copying falls behind
+    jobs = Queue(maxsize=workers * JOBS_PER_WORKER)
+
+    def worker(slot: list) -> None:
+        while (job := jobs.get()) is not None:
+            copy_and_count(*job, slot)
+
+    threads = [threading.Thread(target=worker, args=(slot,)) for slot in totals]
+    for thread in threads:
+        thread.start()
+
+    try:
+        complete = read_folder(source_path, output_path,
+                               for_changed_files(lambda file_path, meta: jobs.put((file_path, meta))))
+    finally:
+        # One stop signal per worker, queued after all copy jobs
+        for _ in threads:
+            jobs.put(None)
+        for thread in threads:
+            thread.join()
+
+    return sum(files for files, _ in totals), sum(size for _, size in totals), complete
+
+def generate_tree(root: Path, files: int, files_per_dir: int = 1000) -> None:
+    """Creates a synthetic tree of empty files, 10 leaf directories per parent."""
+    extensions = ["txt", "jpg", "py", "md", ""]
+    for i in range(files):
+        if i % files_per_dir == 0:
+            directory = root / f"group_{i // files_per_dir // 10}" / f"dir_{i // files_per_dir}"
+            directory.mkdir(parents=True, exist_ok=True)
+        extension = extensions[i % len(extensions)]
+        (directory / (f"file_{i}.{extension}" if extension else f"file_{i}")).touch()
+
+def run_walk_benchmark(source_path: Path, output_path: Path, files: int, repeat: int = 5) -> None:
+    """
+    Compares the walkers on a synthetic tree, without copying anything.
+    Every walker runs `repeat` times and the order alternates between the
+    rounds, so neither of them always gets the cold dentry/page cache.
+    """
+    if not source_path.exists():
+        print(f"Generating {files} files in {source_path}...")
+        generate_tree(source_path, files)
+
+    walkers = [("pathlib (recursive)", read_folder_recursive), ("os.scandir (stack)", read_folder)]
+    times = {name: [] for name, _ in walkers}
+    counts = {}
+    for round_number in range(repeat):
+        for name, walker in (walkers if round_number % 2 == 0 else walkers[::-1]):
+            counter = [0]
+
+            def count_file(file_path: Path, output_folder: Path) -> None:
+                counter[0] += 1
+
+            started_at = time.perf_counter()
+            walker(source_path, output_path, count_file)
+            times[name].append(time.perf_counter() - started_at)
+            counts[name] = counter[0]
+
+    print(f"{'Walker':<20} | {'Files':<10} | {'Min (s)':<10} | {'Median (s)':<10}")
+    print("-" * 60)
+    for name, _ in walkers:
+        print(f"{name:<20} | {counts[name]:<10} | {min(times[name]):<10.3f} | "
+              f"{statistics.median(times[name]):<10.3f}")
+
 def main() -> None:
     # Parse command-line arguments
     args = parse_arguments()
@@ -90,16 +728,44 @@ def main() -> None:
     source_path = Path(args.source_folder)
     output_path = Path(args.output_folder)
 
+    if args.bench_walk:
+        run_walk_benchmark(source_path, output_path, args.bench_walk)
+        return
+
     print(f"Starting process...")
     print(f"Source: {source_path}")
     print(f"Destination: {output_path}")
+    print(f"Workers: {args.workers}, transfer: {args.transfer}")
     print("-" * 30)
 
     # Start the recursive reading and copying process
-    read_folder(source_path, output_path)
+    started_at = time.perf_counter()
+    manifest = Manifest(output_path, args.hash) if args.sync else None
+    try:
+        if args.dedup:
+            files, size, duplicates, saved = dedup_files(source_path, output_path, args.workers,
+                                                         args.transfer, args.dedup)
+        else:
+            files, size, complete = copy_files(source_path, output_path, args.workers, manifest, args.transfer)
+            if args.prune and not complete:
+                # Files of a missing or unreadable folder would look deleted
+                print("Prune skipped: the source folder could not be read completely.")
+                args.prune = False
+        pruned = manifest.save(args.prune) if manifest is not None else 0
+    finally:
+        if manifest is not None:
+            manifest.close()
+    elapsed = time.perf_counter() - started_at
 
     print("-" * 30)
     print("Process completed.")
+    print(f"Copied {files} files ({size / 1024 / 1024:.2f} MB) in {elapsed:.2f} s: "
+          f"{files / elapsed:.1f} files/s, {size / 1024 / 1024 / elapsed:.2f} MB/s")
+    if manifest is not None:
+        print(f"Unchanged (skipped): {manifest.unchanged}, pruned: {pruned}")
+    if args.dedup:
+        print(f"Duplicates: {duplicates} ({saved / 1024 / 1024:.2f} MB not copied), "
+              f"see {output_path / DEDUP_REPORT}")
 
 
 if __name__ == "__main__":
@@ -1,8 +1,25 @@
+import argparse
+import math
+import os
+import timeit
 import turtle
 
+import numpy as np
+
 
 CANVAS_SIZE: int = 1000 # To fit FullHD screens
 
+# Rotation by +60 degrees: the peak of every Koch "bump" lies to the left of
+# the segment direction - same as t.left(60) in koch_curve()
+BUMP_ROTATION = complex(math.cos(math.pi / 3), math.sin(math.pi / 3))
+
+# Turn (in units of 60 degrees) of each of the 4 sub-segments a Koch segment
+# is split into - the k-th segment's direction is the sum over its base-4 digits
+KOCH_TURNS = (0, 1, -1, 0)
+
+# Unit vectors of the 6 possible segment directions (multiples of 60 degrees)
+UNIT_DIRECTIONS = [complex(math.cos(i * math.pi / 3), math.sin(i * math.pi / 3)) for i in range(6)]
+
 def koch_curve(t, order, size) -> None:
     """
     Recursive function to draw one side of the snowflake.
@@ -33,7 +50,258 @@ def draw_snowflake(t, order, size):
         t.right(120)
 
 
-def main():
+def koch_level(points: np.ndarray) -> np.ndarray:
+    """
+    One vectorised Koch iteration over a polyline of complex points:
+    every segment a-b is replaced by four segments a-p1-p2-p3-b.
+    """
+    a = points[:-1]
+    d = (points[1:] - a) / 3.0
+
+    result = np.empty(4 * len(a) + 1, dtype=np.complex128)
+    result[0:-1:4] = a
+    result[1::4] = a + d
+    result[2::4] = a + d + d * BUMP_ROTATION
+    result[3::4] = a + 2.0 * d
+    result[-1] = points[-1]
+    return result
+
+def snowflake_vertices(order: int, size: float = CANVAS_SIZE / 2) -> np.ndarray:
+    """
+    Builds the closed vertex array of the snowflake level by level,
+    without turtle and without recursion. The geometry is the same as
+    draw_snowflake() draws from the same starting point.
+
+    Returns:
+        np.ndarray: (3 * 4^order + 1, 2) array of x, y (last vertex == first).
+    """
+    # Triangle walked clockwise: east, then two right turns by 120 degrees
+    start = complex(-size / 2, size / 3)
+    turn = complex(math.cos(-2 * math.pi / 3), math.sin(-2 * math.pi / 3))
+    points = np.array([start, start + size, start + size + size * turn, start], dtype=np.complex128)
+
+    for _ in range(order):
+        points = koch_level(points)
+
+    return np.column_stack((points.real, points.imag))
+
+def save_svg(vertices: np.ndarray, path: str, stroke: str = "#00FFFF", fill: str = "#003366") -> None:
+    """Writes the vertices as one SVG polygon (the y axis is flipped for SVG)."""
+    min_x, min_y = vertices.min(axis=0)
+    max_x, max_y = vertices.max(axis=0)
+    margin = 10
+
+    with open(path, "w") as f:
+        f.write(f'<svg xmlns="http://www.w3.org/2000/svg" '
+                f'viewBox="{min_x - margin:.3f} {-max_y - margin:.3f} '
+                f'{max_x - min_x + 2 * margin:.3f} {max_y - min_y + 2 * margin:.3f}" style="background:#000022">\n')
+        f.write(f'<polygon stroke="{stroke}" fill="{fill}" stroke-width="1" points="')
+        np.savetxt(f, vertices * (1, -1), fmt="%.3f,%.3f", newline=" ")
+        f.write('"/>\n</svg>\n')
+
+def save_png(vertices: np.ndarray, path: str, pixels: int = CANVAS_SIZE) -> None:
+    """Renders the filled snowflake to a PNG file without a display."""
+    # Imported here, so that the turtle and SVG modes don't need matplotlib
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig = plt.figure(figsize=(pixels / 100, pixels / 100), dpi=100, facecolor="#000022")
+    ax = fig.add_axes((0, 0, 1, 1))
+    ax.set_axis_off()
+    ax.set_aspect("equal")
+    ax.fill(vertices[:, 0], vertices[:, 1], facecolor="#003366", edgecolor="#00FFFF", linewidth=0.5)
+    fig.savefig(path, facecolor=fig.get_facecolor())
+    plt.close(fig)
+
+def export_snowflake(order: int, path: str) -> None:
+    """Exports the snowflake to .svg, .png or .npy depending on the file extension."""
+    vertices = snowflake_vertices(order)
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == ".svg":
+        save_svg(vertices, path)
+    elif extension == ".png":
+        save_png(vertices, path)
+    elif extension == ".npy":
+        np.save(path, vertices)
+    else:
+        raise ValueError(f"Unsupported export format: {extension}")
+
+    print(f"Saved snowflake level {order} ({len(vertices) - 1} segments) to {path}")
+
+
+def koch_segment_direction(k: int, order: int) -> int:
+    """Direction (0..5, in units of 60 degrees) of the k-th segment of a Koch curve."""
+    direction = 0
+    for _ in range(order):
+        direction += KOCH_TURNS[k % 4]
+        k //= 4
+    return direction % 6
+
+def koch_point_at(k: int, order: int, start: complex = 0j, end: complex = 1 + 0j) -> complex:
+    """
+    Start point of the k-th segment (0 <= k <= 4^order, k == 4^order gives the end)
+    of the Koch curve from start to end. Computed directly from the base-4
+    digits of k in O(order) - no preceding segments are generated.
+    """
+    if k == 4 ** order:
+        return end
+
+    point = start
+    scale = end - start
+    direction = 0
+
+    # From the most significant digit: skip d whole sub-segments of the current level
+    for level in range(order - 1, -1, -1):
+        scale /= 3
+        digit = (k // 4 ** level) % 4
+        for i in range(digit):
+            point += scale * UNIT_DIRECTIONS[(direction + KOCH_TURNS[i]) % 6]
+        direction = (direction + KOCH_TURNS[digit]) % 6
+
+    return point
+
+def koch_segment_at(k: int, order: int, start: complex = 0j, end: complex = 1 + 0j) -> tuple:
+    """Returns the k-th segment of the Koch curve as a (start, end) pair of complex points."""
+    segment_start = koch_point_at(k, order, start, end)
+    step = (end - start) / 3 ** order * UNIT_DIRECTIONS[koch_segment_direction(k, order)]
+    return segment_start, segment_start + step
+
+def koch_points(order: int, start: complex = 0j, end: complex = 1 + 0j):
+    """
+    Lazily yields the 4^order + 1 vertices of the Koch curve from start to end
+    (same curve as koch_curve() draws). Iterative, the state is the base-4
+    digits of the current segment index - O(order) memory.
+    """
+    step = (end - start) / 3 ** order
+    digits = [0] * order  # least significant first
+    direction = 0
+    point = start
+    yield point
+
+    for _ in range(4 ** order):
+        point += step * UNIT_DIRECTIONS[direction]
+        yield point
+
+        # Increment the base-4 counter and update the direction by the turns of the changed digits
+        # (3 -> 0 doesn't change the direction, both turns are 0)
+        i = 0
+        while i < order and digits[i] == 3:
+            digits[i] = 0
+            i += 1
+        if i < order:
+            digit = digits[i]
+            direction = (direction - KOCH_TURNS[digit] + KOCH_TURNS[digit + 1]) % 6
+            digits[i] = digit + 1
+
+def snowflake_sides(size: float = CANVAS_SIZE / 2) -> list:
+    """(start, end) of the three sides, in the order draw_snowflake() draws them."""
+    start = complex(-size / 2, size / 3)
+    corners = [start, start + size * UNIT_DIRECTIONS[0], start + size * UNIT_DIRECTIONS[0] + size * UNIT_DIRECTIONS[4]]
+    return [(corners[i], corners[(i + 1) % 3]) for i in range(3)]
+
+def snowflake_points(order: int, size: float = CANVAS_SIZE / 2):
+    """Lazily yields the closed list of snowflake vertices (the first vertex repeats at the end)."""
+    for i, (start, end) in enumerate(snowflake_sides(size)):
+        points = koch_points(order, start, end)
+        if i > 0:
+            next(points)  # the corner was already yielded as the end of the previous side
+        yield from points
+
+def write_snowflake_points(path: str, order: int, size: float = CANVAS_SIZE / 2,
+                           chunk_order: int = 10, dtype=np.float32) -> int:
+    """
+    Streams the snowflake vertices to a raw binary file of interleaved x, y
+    values, 4^chunk_order segments at a time. Each chunk is one vectorised
+    cumulative sum over a precomputed direction pattern, started from the
+    exact point given by koch_point_at(), so rounding errors don't
+    accumulate across chunks. Memory depends on chunk_order, not on order.
+
+    Returns:
+        int: Number of vertices written.
+    """
+    chunk_order = min(chunk_order, order)
+    chunk = 4 ** chunk_order
+
+    # Direction pattern of a level-chunk_order curve, built iteratively
+    pattern = np.zeros(1, dtype=np.int8)
+    for _ in range(chunk_order):
+        pattern = np.concatenate([pattern + turn for turn in KOCH_TURNS])
+    directions = np.array(UNIT_DIRECTIONS, dtype=np.complex128)
+
+    written = 0
+    with open(path, "wb") as f:
+        for i, (start, end) in enumerate(snowflake_sides(size)):
+            step = (end - start) / 3 ** order
+            if i == 0:
+                np.array([start.real, start.imag], dtype=dtype).tofile(f)
+                written += 1
+
+            for block in range(4 ** (order - chunk_order)):
+                first = block * chunk
+                block_start = koch_point_at(first, order, start, end)
+                offset = koch_segment_direction(first, order)
+
+                points = block_start + np.cumsum(step * directions[(pattern + offset) % 6])
+                np.column_stack((points.real, points.imag)).astype(dtype).tofile(f)
+                written += len(points)
+
+    return written
+
+
+class PointRecorder:
+    """
+    Minimal stand-in for a turtle: records the vertices instead of drawing,
+    so the recursive koch_curve() can run headless (used by the benchmark).
+    """
+
+    def __init__(self):
+        self.position = 0j
+        self.heading = 1 + 0j
+        self.points = [self.position]
+
+    def forward(self, distance):
+        self.position += self.heading * distance
+        self.points.append(self.position)
+
+    def left(self, angle):
+        self.heading *= complex(math.cos(math.radians(angle)), math.sin(math.radians(angle)))
+
+    def right(self, angle):
+        self.left(-angle)
+
+
+def run_benchmark(max_order: int = 10, max_recursive_order: int = 7) -> None:
+    """Compares the recursive koch_curve() with the vectorised generator."""
+    size = CANVAS_SIZE / 2
+
+    print(f"{'Level':<6} | {'Segments':<10} | {'Recursive (s)':<14} | {'Vectorised (s)':<14}")
+    print("-" * 55)
+    for order in range(max_order + 1):
+        recursive = "-"
+        if order <= max_recursive_order:
+            recursive = f"{timeit.timeit(lambda: draw_snowflake(PointRecorder(), order, size), number=1):.6f}"
+        vectorised = timeit.timeit(lambda: snowflake_vertices(order, size), number=1)
+        print(f"{order:<6} | {3 * 4 ** order:<10} | {recursive:<14} | {vectorised:<14.6f}")
+
+def parse_arguments():
+    """
+    Parses command-line arguments.
+    Without --export / --bench the snowflake is drawn with turtle.
+    """
+    parser = argparse.ArgumentParser(description="Koch snowflake.")
+
+    parser.add_argument("--level", type=int, default=3, help="Recursion level for the headless export")
+    parser.add_argument("--export", metavar="FILE", help="Headless mode: save the snowflake to .svg, .png or .npy")
+    parser.add_argument("--bench", action="store_true", help="Compare recursive and vectorised generation")
+    parser.add_argument("--stream", metavar="FILE",
+                        help="Stream the vertices of level --level to a raw float32 x, y file in chunks")
+    parser.add_argument("--chunk-order", type=int, default=10, help="4^N segments per chunk in --stream mode")
+
+    return parser.parse_args()
+
+def draw_with_turtle():
     # --- Screen setup ---
     screen = turtle.Screen()
     screen.setup(width=CANVAS_SIZE, height=CANVAS_SIZE)
@@ -83,5 +351,19 @@ def main():
     screen.exitonclick()
 
 
+def main():
+    args = parse_arguments()
+
+    if args.bench:
+        run_benchmark()
+    elif args.stream:
+        written = write_snowflake_points(args.stream, args.level, chunk_order=args.chunk_order)
+        print(f"Saved {written} vertices of snowflake level {args.level} to {args.stream}")
+    elif args.export:
+        export_snowflake(args.level, args.export)
+    else:
+        draw_with_turtle()
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,3 +1,13 @@
+import argparse
+import json
+import os
+import string
+import time
+
+# Base block of the binary move stream: 2^20 - 1 moves (1 MB)
+BINARY_BLOCK_ORDER: int = 20
+
+
 def hanoi_solver(n, source, target, auxiliary, state, step_counter):
     """
     Recursive function to solve the Tower of Hanoi puzzle with step numbering.
@@ -30,9 +40,308 @@ def hanoi_solver(n, source, target, auxiliary, state, step_counter):
         # Step 3: Move the n-1 disks from auxiliary to target
         hanoi_solver(n - 1, auxiliary, target, source, state, step_counter)
 
+def _rod_order(n: int, source: str, target: str, auxiliary: str) -> tuple:
+    """
+    The bit formulas below move the tower from rod index 0 to rod index 2
+    for odd n and to rod index 1 for even n - map the indexes to rod names.
+    """
+    return (source, auxiliary, target) if n % 2 else (source, target, auxiliary)
+
+def move_at(k: int, n: int, source: str = 'A', target: str = 'C', auxiliary: str = 'B') -> tuple:
+    """
+    Computes the k-th move (1 <= k <= 2^n - 1) of the optimal solution in O(1),
+    without simulating the previous moves.
+
+    Returns:
+        tuple: (disk, from rod, to rod)
+
+    Raises:
+        ValueError: If k is not a move number of n disks.
+    """
+    if not 1 <= k <= (1 << n) - 1:
+        raise ValueError(f"Move number must be between 1 and {(1 << n) - 1}, got {k}")
+    rods = _rod_order(n, source, target, auxiliary)
+    # The disk is the number of trailing zeros of k plus one
+    disk = (k & -k).bit_length()
+    return disk, rods[(k & (k - 1)) % 3], rods[((k | (k - 1)) + 1) % 3]
+
+def state_at(k: int, n: int, source: str = 'A', target: str = 'C', auxiliary: str = 'B') -> dict:
+    """
+    Computes the rods after the first k moves in O(n), without simulation.
+    Disk d has moved (k + 2^(d-1)) >> d times, always cycling in the same
+    direction: odd disks 0 -> 2 -> 1, even disks 0 -> 1 -> 2 (rod indexes).
+
+    Returns:
+        dict: Same format as the towers state in main(), e.g. {'A': [3, 2], 'B': [], 'C': [1]}.
+
+    Raises:
+        ValueError: If k is not between 0 and 2^n - 1.
+    """
+    if not 0 <= k <= (1 << n) - 1:
+        raise ValueError(f"Number of moves must be between 0 and {(1 << n) - 1}, got {k}")
+    rods = _rod_order(n, source, target, auxiliary)
+    state = {rod: [] for rod in (source, auxiliary, target)}
+
+    # From the largest disk, so every rod list ends up ordered bottom -> top
+    for disk in range(n, 0, -1):
+        moves = (k + (1 << (disk - 1))) >> disk
+        rod = (moves * (2 if disk % 2 else 1)) % 3
+        state[rods[rod]].append(disk)
+
+    return state
+
+def hanoi_moves(n: int, source: str = 'A', target: str = 'C', auxiliary: str = 'B'):
+    """
+    Iterative, O(1)-memory generator of all 2^n - 1 moves of the solution.
+
+    Yields:
+        tuple: (step number, disk, from rod, to rod)
+    """
+    rods = _rod_order(n, source, target, auxiliary)
+    for k in range(1, 1 << n):
+        yield k, (k & -k).bit_length(), rods[(k & (k - 1)) % 3], rods[((k | (k - 1)) + 1) % 3]
+
+def _shift_table(shift: int) -> bytes:
+    """bytes.translate table that adds `shift` (mod 3) to both rod indexes of a move code."""
+    table = bytearray(range(256))
+    for source in range(3):
+        for target in range(3):
+            table[3 * source + target] = 3 * ((source + shift) % 3) + (target + shift) % 3
+    return bytes(table)
+
+def write_moves_binary(path: str, n: int, block_order: int = BINARY_BLOCK_ORDER) -> int:
+    """
+    Streams all moves to a file, one byte per move: 3 * from + to, where
+    from and to are indexes in (source, auxiliary, target). The disk of the
+    k-th move is implied by k (trailing zeros + 1).
+
+    The k-th move's rod indexes shift by (k - j) mod 3 relative to the j-th
+    move when k - j is a multiple of a power of two larger than j. So the
+    stream is one precomputed block of 2^block_order - 1 moves, cyclically
+    relabeled with bytes.translate, with a single move between the blocks -
+    no per-move Python code and constant memory.
+
+    Returns:
+        int: Number of moves written.
+    """
+    shift_tables = [_shift_table(shift) for shift in range(3)]
+
+    def code(k: int) -> int:
+        return 3 * ((k & (k - 1)) % 3) + ((k | (k - 1)) + 1) % 3
+
+    # Moves 1 .. 2^m - 1 built by doubling: S(j+1) = S(j) + move 2^j + S(j) shifted by 2^j mod 3
+    block_order = min(block_order, n)
+    block = b""
+    for j in range(block_order):
+        block = block + bytes([code(1 << j)]) + block.translate(shift_tables[(1 << j) % 3])
+
+    # Formula rod indexes -> indexes in (source, auxiliary, target)
+    output_table = bytearray(range(256))
+    for source in range(3):
+        for target in range(3):
+            output_table[3 * source + target] = 3 * source + target if n % 2 else \
+                3 * (0, 2, 1)[source] + (0, 2, 1)[target]
+    output_table = bytes(output_table)
+
+    variants = [block.translate(shift_tables[shift]).translate(output_table) for shift in range(3)]
+
+    blocks = 1 << (n - block_order)
+    with open(path, "wb") as f:
+        for b in range(blocks):
+            f.write(variants[(b << block_order) % 3])
+            if b < blocks - 1:
+                f.write(bytes([code((b + 1) << block_order)]).translate(output_table))
+
+    return (1 << n) - 1
+
+class FrameStewartTable:
+    """
+    Memoised Frame-Stewart table for k >= 3 pegs:
+        moves[k][n] - number of moves for n disks,
+        splits[k][n] - how many top disks to park on a spare peg first.
+
+    FS(n, 3) = 2^n - 1, FS(n, k) = min over t of 2 * FS(t, k) + FS(n - t, k - 1).
+    Both terms are convex in t, so their sum is too, and the best t moves
+    only forward as n grows: the search starts at the previous split and
+    stops at the first increase - O(n * k) to build instead of O(n^2 * k).
+
+    The table only grows, is shared by all calls (see frame_stewart_table)
+    and can be saved to / loaded from a JSON file.
+    """
+
+    def __init__(self):
+        self.moves = {}
+        self.splits = {}
+
+    def ensure(self, n: int, pegs: int) -> None:
+        """Extends the table to cover n disks on 3..pegs pegs."""
+        for k in range(3, pegs + 1):
+            moves = self.moves.setdefault(k, [0, 1])
+            splits = self.splits.setdefault(k, [0, 0])
+
+            while len(moves) <= n:
+                size = len(moves)
+                if k == 3:
+                    moves.append(2 * moves[-1] + 1)
+                    splits.append(size - 1)
+                    continue
+
+                smaller = self.moves[k - 1]
+                t = max(splits[-1], 1)
+                best = 2 * moves[t] + smaller[size - t]
+                while t + 1 < size and 2 * moves[t + 1] + smaller[size - t - 1] <= best:
+                    t += 1
+                    best = 2 * moves[t] + smaller[size - t]
+
+                moves.append(best)
+                splits.append(t)
+
+    def count(self, n: int, pegs: int) -> int:
+        self.ensure(n, pegs)
+        return self.moves[pegs][n]
+
+    def save(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump({"moves": self.moves, "splits": self.splits}, f)
+
+    def load(self, path: str) -> None:
+        with open(path) as f:
+            data = json.load(f)
+        # JSON object keys are strings
+        self.moves = {int(k): v for k, v in data["moves"].items()}
+        self.splits = {int(k): v for k, v in data["splits"].items()}
+
+
+# Shared by all calls of frame_stewart_moves()
+frame_stewart_table = FrameStewartTable()
+
+def frame_stewart_moves(n: int, pegs: list):
+    """
+    Streams the Frame-Stewart moves of n disks from pegs[0] to pegs[-1]
+    using all the pegs. Uses an explicit stack instead of recursion and
+    the iterative hanoi_moves() for 3-peg subproblems.
+
+    Yields:
+        tuple: (step number, disk, from peg, to peg) - same as hanoi_moves()
+    """
+    frame_stewart_table.ensure(n, len(pegs))
+    splits = frame_stewart_table.splits
+
+    step = 0
+    # Tasks: (number of disks, smallest disk - 1, source, target, spare pegs)
+    stack = [(n, 0, pegs[0], pegs[-1], list(pegs[1:-1]))]
+
+    while stack:
+        count, base, source, target, spares = stack.pop()
+        if count == 0:
+            continue
+
+        if len(spares) == 1 or count == 1:
+            for _, disk, from_peg, to_peg in hanoi_moves(count, source, target, spares[0]):
+                step += 1
+                yield step, base + disk, from_peg, to_peg
+            continue
+
+        # Park the t smallest disks on a spare, move the rest with one peg fewer, bring the t back
+        t = splits[len(spares) + 2][count]
+        park = spares[0]
+        others = spares[1:]
+        stack.append((t, base, park, target, [source] + others))
+        stack.append((count - t, base + t, source, target, others))
+        stack.append((t, base, source, park, others + [target]))
+
+def run_pegs_benchmark(pegs: int = 4) -> None:
+    """Measures the table build time and the move generation rate of the k-peg solver."""
+    print(f"{'Disks':<8} | {'Pegs':<5} | {'Table build (s)':<16}")
+    print("-" * 35)
+    for n in (1000, 5000, 20000):
+        table = FrameStewartTable()
+        started_at = time.perf_counter()
+        table.ensure(n, pegs)
+        print(f"{n:<8} | {pegs:<5} | {time.perf_counter() - started_at:<16.6f}")
+
+    print(f"\n{'Disks':<6} | {'Moves (k pegs)':<15} | {'Moves (3 pegs)':<15} | {'Moves/s':<12}")
+    print("-" * 58)
+    for n in (20, 50, 100, 150):
+        peg_names = list(string.ascii_uppercase[:pegs])
+        started_at = time.perf_counter()
+        moves = sum(1 for _ in frame_stewart_moves(n, peg_names))
+        elapsed = time.perf_counter() - started_at
+        print(f"{n:<6} | {moves:<15} | {(1 << n) - 1:<15.3e} | {moves / elapsed:<12.0f}")
+
+def parse_arguments():
+    """
+    Parses command-line arguments.
+    Without arguments every move of 5 disks is printed with the state.
+    """
+    parser = argparse.ArgumentParser(description="Tower of Hanoi solver.")
+
+    parser.add_argument("-n", "--disks", type=int, default=5, help="Number of disks")
+    parser.add_argument("--iterative", action="store_true", help="Print the moves of the non-recursive generator")
+    parser.add_argument("--quiet", action="store_true",
+                        help="Generate all moves without printing them, report only the count and time")
+    parser.add_argument("--binary", metavar="FILE", help="Write all moves to FILE, one byte per move")
+    parser.add_argument("--step", type=int, help="Print the k-th move and the state after it")
+    parser.add_argument("-k", "--pegs", type=int, default=3, help="Number of pegs (4+ uses Frame-Stewart)")
+    parser.add_argument("--table", metavar="FILE",
+                        help="Load the Frame-Stewart table from FILE (if it exists) and save it back")
+    parser.add_argument("--bench-pegs", action="store_true",
+                        help="Benchmark the Frame-Stewart table build and move generation")
+
+    args = parser.parse_args()
+    if args.pegs < 3:
+        parser.error("--pegs must be at least 3")
+    if args.pegs > 3 and (args.step is not None or args.binary):
+        parser.error("--step and --binary support only 3 pegs")
+    if args.step is not None and not 1 <= args.step <= (1 << args.disks) - 1:
+        parser.error(f"--step must be between 1 and {(1 << args.disks) - 1} for {args.disks} disks")
+    return args
+
 def main() -> None:
-    # Configuration: number of disks
-    number_of_disks = 5
+    args = parse_arguments()
+    number_of_disks = args.disks
+
+    if args.bench_pegs:
+        run_pegs_benchmark(max(args.pegs, 4))
+        return
+
+    if args.pegs > 3:
+        if args.table and os.path.exists(args.table):
+            frame_stewart_table.load(args.table)
+
+        peg_names = list(string.ascii_uppercase[:args.pegs])
+        started_at = time.perf_counter()
+        moves = 0
+        for moves, disk, source, target in frame_stewart_moves(number_of_disks, peg_names):
+            if not args.quiet:
+                print(f"{moves}. Move the disk {disk} from {source} to {target}")
+        print(f"{moves} moves on {args.pegs} pegs (3 pegs: {(1 << number_of_disks) - 1}) "
+              f"in {time.perf_counter() - started_at:.3f} s")
+
+        if args.table:
+            frame_stewart_table.save(args.table)
+        return
+
+    if args.step is not None:
+        disk, source, target = move_at(args.step, number_of_disks)
+        print(f"{args.step}. Move the disk {disk} from {source} to {target}")
+        print(f"State after moving: {state_at(args.step, number_of_disks)}")
+        return
+
+    if args.binary or args.quiet:
+        started_at = time.perf_counter()
+        if args.binary:
+            moves = write_moves_binary(args.binary, number_of_disks)
+        else:
+            moves = sum(1 for _ in hanoi_moves(number_of_disks))
+        print(f"{moves} moves generated in {time.perf_counter() - started_at:.3f} s")
+        print(f"Final state: {state_at(moves, number_of_disks)}")
+        return
+
+    if args.iterative:
+        for step, disk, source, target in hanoi_moves(number_of_disks):
+            print(f"{step}. Move the disk {disk} from {source} to {target}")
+        return
 
     # Initialize the state of the towers
     towers_state = {
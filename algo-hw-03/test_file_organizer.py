@@ -0,0 +1,32 @@
+import importlib.util
+import os
+from pathlib import Path
+
+import pytest
+
+spec = importlib.util.spec_from_file_location(
+    "file_organizer", os.path.join(os.path.dirname(os.path.abspath(__file__)), "01_file_organizer.py"))
+file_organizer = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(file_organizer)
+
+
+@pytest.mark.parametrize("mode", ["hardlink", "symlink"])
+def test_dedup_links_duplicate_with_another_extension(tmp_path: Path, mode: str):
+    source = tmp_path / "src"
+    (source / "a").mkdir(parents=True)
+    (source / "b").mkdir()
+    (source / "a" / "x.txt").write_bytes(b"same content")
+    (source / "b" / "z.md").write_bytes(b"same content")
+    output = tmp_path / "out"
+
+    files, _, duplicates, _ = file_organizer.dedup_files(source, output, mode=mode)
+
+    assert (files, duplicates) == (1, 1)
+    stored = output / "txt" / "x.txt"
+    link = output / "md" / "z.md"
+    assert link.read_bytes() == b"same content"
+    if mode == "hardlink":
+        assert os.path.samefile(link, stored)
+    else:
+        assert link.is_symlink()
+    assert f"-> {link}" in (output / file_organizer.DEDUP_REPORT).read_text(encoding="utf-8")
@@ -1,6 +1,21 @@
+import argparse
+import bisect
+import csv
+import json
+import math
+import os
 import random
-import timeit
+import statistics
+import string
 import sys
+import time
+import tracemalloc
+from array import array
+from itertools import chain
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
 
 # Increase recursion depth limit for large mergesort
 sys.setrecursionlimit(2000)
@@ -67,40 +82,909 @@ def merge_sort(arr):
             k += 1
 
 
-def run_benchmark():
+def _merge_pass(src, dst, n, width, reverse):
+    """
+    Merges every pair of neighbouring runs of length `width` from src into dst.
+    Takes from the right run only when its head is strictly smaller (larger for
+    reverse), so equal elements keep their order - the merge is stable.
+    """
+    for lo in range(0, n, 2 * width):
+        mid = min(lo + width, n)
+        hi = min(lo + 2 * width, n)
+
+        # Runs already in order (or a lone run at the end) - copy them as a block
+        if mid == hi or not ((src[mid - 1] < src[mid]) if reverse else (src[mid] < src[mid - 1])):
+            dst[lo:hi] = src[lo:hi]
+            continue
+
+        i, j, k = lo, mid, lo
+        if reverse:
+            while i < mid and j < hi:
+                if src[i] < src[j]:
+                    dst[k] = src[j]
+                    j += 1
+                else:
+                    dst[k] = src[i]
+                    i += 1
+                k += 1
+        else:
+            while i < mid and j < hi:
+                if src[j] < src[i]:
+                    dst[k] = src[j]
+                    j += 1
+                else:
+                    dst[k] = src[i]
+                    i += 1
+                k += 1
+
+        # Only one of the runs can have a tail left
+        if i < mid:
+            dst[k:hi] = src[i:mid]
+        else:
+            dst[k:hi] = src[j:hi]
+
+
+def merge_sort_bottom_up(arr, key=None, reverse=False):
+    """
+    Iterative bottom-up Merge Sort: merges runs of 1, 2, 4, ... elements,
+    ping-ponging between the input list and a single auxiliary buffer.
+    No recursion and no slicing into halves - O(n) extra memory in total.
+    Stable, supports key= and reverse= like list.sort().
+    Time Complexity: O(n log n)
+    """
+    n = len(arr)
+    if n < 2:
+        return
+
+    if key is not None:
+        # Decorate-sort-undecorate. The position makes every item unique (so order
+        # of equal keys is kept); it is negated for reverse to stay ascending.
+        sign = -1 if reverse else 1
+        src = [(key(item), sign * index) for index, item in enumerate(arr)]
+    else:
+        src = arr
+    dst = [None] * n
+
+    width = 1
+    while width < n:
+        _merge_pass(src, dst, n, width, reverse)
+        src, dst = dst, src
+        width *= 2
+
+    if key is not None:
+        arr[:] = [arr[abs(index)] for _, index in src]
+    elif src is not arr:
+        arr[:] = src
+
+
+# Runs shorter than this are extended with binary insertion sort before merging.
+# Python-level merging is expensive compared to C-level bisect/list.insert,
+# so larger runs pay off: 64-128 measured fastest on 10^5 random ints (see --tune-hybrid).
+HYBRID_MIN_MERGE = 64
+
+# Consecutive wins of one run after which the merge switches to galloping
+MIN_GALLOP = 7
+
+
+def binary_insertion_sort(arr, lo, hi, start):
+    """
+    Insertion Sort of arr[lo:hi] where arr[lo:start] is already sorted.
+    The position is found with binary search and the shift is one slice
+    assignment, so only O(log n) comparisons per element are made in Python.
+    Stable: an element goes after all equal ones (bisect_right).
+    """
+    for i in range(start, hi):
+        pivot = arr[i]
+        position = bisect.bisect_right(arr, pivot, lo, i)
+        if position != i:
+            # Shift only inside the run - del/insert would move the whole list tail
+            arr[position + 1:i + 1] = arr[position:i]
+            arr[position] = pivot
+
+
+def _count_run(arr, lo, hi):
+    """
+    Returns the end of the natural run starting at lo. A strictly descending
+    run is reversed in place (strictness keeps the sort stable).
+    """
+    end = lo + 1
+    if end == hi:
+        return end
+
+    if arr[end] < arr[lo]:
+        while end + 1 < hi and arr[end + 1] < arr[end]:
+            end += 1
+        end += 1
+        arr[lo:end] = arr[lo:end][::-1]
+    else:
+        while end + 1 < hi and not arr[end + 1] < arr[end]:
+            end += 1
+        end += 1
+    return end
+
+
+def _gallop(x, a, lo, hi, right):
+    """
+    Exponential search in sorted a[lo:hi] starting from lo: probes lo, lo+1,
+    lo+3, lo+7, ... and then binary-searches the bracket. Costs O(log d)
+    where d is the distance of the answer from lo.
+
+    Returns:
+        int: bisect_right (right=True) or bisect_left position of x
+    """
+    last, offset = lo, 1
+    while lo + offset - 1 < hi:
+        probe = a[lo + offset - 1]
+        if (x < probe) if right else not (probe < x):
+            break
+        last = lo + offset
+        offset *= 2
+    search = bisect.bisect_right if right else bisect.bisect_left
+    return search(a, x, last, min(lo + offset - 1, hi))
+
+
+def _merge_runs(arr, lo, mid, hi):
+    """Stable in-place merge of the sorted neighbouring runs arr[lo:mid] and arr[mid:hi]."""
+    # Elements already in their final place need no merging at all
+    lo = bisect.bisect_right(arr, arr[mid], lo, mid)
+    if lo == mid:
+        return
+    hi = bisect.bisect_left(arr, arr[mid - 1], mid, hi)
+
+    left = arr[lo:mid]
+    left_size = len(left)
+    i, j, k = 0, mid, lo
+    left_wins = right_wins = 0
+
+    while i < left_size and j < hi:
+        if arr[j] < left[i]:
+            arr[k] = arr[j]
+            j += 1
+            k += 1
+            right_wins += 1
+            left_wins = 0
+            if right_wins >= MIN_GALLOP:
+                # Copy every right element smaller than the left head as one block
+                end = _gallop(left[i], arr, j, hi, right=False)
+                arr[k:k + end - j] = arr[j:end]
+                k += end - j
+                j = end
+                right_wins = 0
+        else:
+            arr[k] = left[i]
+            i += 1
+            k += 1
+            left_wins += 1
+            right_wins = 0
+            if left_wins >= MIN_GALLOP and j < hi:
+                # Copy every left element not greater than the right head as one block
+                end = _gallop(arr[j], left, i, left_size, right=True)
+                arr[k:k + end - i] = left[i:end]
+                k += end - i
+                i = end
+                left_wins = 0
+
+    # The rest of the right run is already in place
+    if i < left_size:
+        arr[k:k + left_size - i] = left[i:]
+
+
+def hybrid_sort(arr, min_merge=HYBRID_MIN_MERGE):
+    """
+    Adaptive hybrid of Insertion Sort and Merge Sort (a simplified Timsort):
+    1. splits the input into natural ascending / descending runs,
+    2. extends runs shorter than `min_merge` with binary insertion sort,
+    3. merges the runs with galloping merges, keeping the run lengths balanced.
+    Nearly sorted data consists of a few long runs and sorts in close to O(n).
+    Time Complexity: O(n log n) worst case, O(n) on sorted input
+    """
+    n = len(arr)
+    if n < 2:
+        return
+
+    # Stack of (start, length). Invariants: every run is longer than the next
+    # one and than the sum of the two next ones - merges stay balanced.
+    runs = []
+    lo = 0
+    while lo < n:
+        end = _count_run(arr, lo, n)
+        if end - lo < min_merge:
+            forced_end = min(lo + min_merge, n)
+            binary_insertion_sort(arr, lo, forced_end, end)
+            end = forced_end
+        runs.append((lo, end - lo))
+        lo = end
+
+        while len(runs) > 1:
+            i = len(runs) - 2
+            if ((i > 0 and runs[i - 1][1] <= runs[i][1] + runs[i + 1][1])
+                    or (i > 1 and runs[i - 2][1] <= runs[i - 1][1] + runs[i][1])):
+                if runs[i - 1][1] < runs[i + 1][1]:
+                    i -= 1
+            elif runs[i][1] > runs[i + 1][1]:
+                break
+            _merge_at(arr, runs, i)
+
+    while len(runs) > 1:
+        _merge_at(arr, runs, len(runs) - 2)
+
+
+def _merge_at(arr, runs, i):
+    """Merges the runs number i and i + 1 of the run stack."""
+    start, length = runs[i]
+    next_start, next_length = runs[i + 1]
+    _merge_runs(arr, start, next_start, next_start + next_length)
+    runs[i:i + 2] = [(start, length + next_length)]
+
+
+# ------------------------------------------
+# Integer sorts (no comparisons)
+# ------------------------------------------
+
+# Digit size of the LSD radix sort: 8 bits for Python lists/arrays (256 buckets),
+# 16 bits for NumPy, where a stable argsort of uint16 digits is itself a radix pass
+RADIX_BITS = 8
+NUMPY_RADIX_BITS = 16
+
+
+def _as_result(values, like):
+    """Returns the sorted values in the container type of the input."""
+    if isinstance(like, array):
+        return array(like.typecode, values)
+    return list(values)
+
+
+def counting_sort(values, max_value=None, argsort=False):
+    """
+    Counting Sort of non-negative integers (list, array('I') or NumPy array).
+    Time Complexity: O(n + max_value)
+
+    Args:
+        values: Non-negative integers
+        max_value (int): Largest value, computed if not given
+        argsort (bool): Return the stable sorting permutation instead of the values
+
+    Returns:
+        Sorted values (same container type) or indices: values[indices] is sorted
+    """
+    if isinstance(values, np.ndarray):
+        if argsort:
+            return radix_sort(values, argsort=True)
+        counts = np.bincount(values, minlength=0 if max_value is None else max_value + 1)
+        return np.repeat(np.arange(len(counts), dtype=values.dtype), counts)
+
+    if not len(values):
+        return [] if argsort else _as_result([], values)
+    if max_value is None:
+        max_value = max(values)
+
+    counts = [0] * (max_value + 1)
+    for value in values:
+        counts[value] += 1
+
+    if not argsort:
+        result = array("Q")
+        for value, count in enumerate(counts):
+            if count:
+                result += array("Q", [value]) * count
+        return _as_result(result, values)
+
+    # Exclusive prefix sums - the first output position of every value
+    position = 0
+    for value, count in enumerate(counts):
+        counts[value] = position
+        position += count
+
+    order = [0] * len(values)
+    for index, value in enumerate(values):
+        order[counts[value]] = index
+        counts[value] += 1
+    return order
+
+
+def radix_sort(values, argsort=False):
+    """
+    LSD Radix Sort of non-negative integers (list, array('I') or NumPy array):
+    stable distribution by digits, from the least significant one.
+    Time Complexity: O(n * number of digits)
+
+    Args:
+        values: Non-negative integers
+        argsort (bool): Return the stable sorting permutation instead of the values,
+                        e.g. to sort records by an integer key
+
+    Returns:
+        Sorted values (same container type) or indices: values[indices] is sorted
+    """
+    if isinstance(values, np.ndarray):
+        return _radix_sort_numpy(values, argsort)
+
+    if not len(values):
+        return [] if argsort else _as_result([], values)
+
+    max_value = max(values)
+    mask = (1 << RADIX_BITS) - 1
+    current = range(len(values)) if argsort else values
+    shift = 0
+    while True:
+        buckets = [[] for _ in range(mask + 1)]
+        if argsort:
+            for index in current:
+                buckets[(values[index] >> shift) & mask].append(index)
+        else:
+            for value in current:
+                buckets[(value >> shift) & mask].append(value)
+        current = list(chain.from_iterable(buckets))
+
+        shift += RADIX_BITS
+        if max_value >> shift == 0:
+            break
+
+    return current if argsort else _as_result(current, values)
+
+
+def _radix_sort_numpy(values, argsort):
+    """Vectorised LSD Radix Sort: one stable counting pass per 16-bit digit."""
+    mask = (1 << NUMPY_RADIX_BITS) - 1
+    max_value = int(values.max()) if len(values) else 0
+    order = np.arange(len(values)) if argsort else None
+    current = values
+
+    shift = 0
+    while True:
+        digits = ((current >> shift) & mask).astype(np.uint16)
+        # NumPy uses radix sort for the stable sort of 16-bit integers
+        step = np.argsort(digits, kind="stable")
+        if argsort:
+            order = order[step]
+        current = current[step]
+
+        shift += NUMPY_RADIX_BITS
+        if max_value >> shift == 0:
+            break
+
+    return order if argsort else current
+
+
+def _sort_in_place(sort_func):
+    """Adapts a sort that returns a new container to the in-place interface of the suite."""
+    def sort_list(arr):
+        arr[:] = sort_func(arr)
+    return sort_list
+
+
+# ------------------------------------------
+# Parallel merge sort
+# ------------------------------------------
+
+# Views of the shared input/output buffers inside a worker process
+_shared = {}
+
+
+def _attach_shared(input_memory, output_memory, dtype, size):
+    """Pool initializer: maps the shared buffers as NumPy arrays (no copies)."""
+    _shared["memory"] = (input_memory, output_memory)
+    _shared["input"] = np.ndarray(size, dtype=dtype, buffer=input_memory.buf)
+    _shared["output"] = np.ndarray(size, dtype=dtype, buffer=output_memory.buf)
+
+
+def _sort_segment(bounds):
+    """Worker: sorts input[lo:hi] in place."""
+    lo, hi = bounds
+    _shared["input"][lo:hi].sort(kind="stable")
+
+
+def _merge_partition(task):
+    """
+    Worker: merges its slice of every sorted run into output[start:].
+    The slices are copied one after another and merged by the stable sort,
+    which for these dtypes is Timsort: it finds the k runs and merges them.
+    """
+    start, pieces = task
+    data, output = _shared["input"], _shared["output"]
+    position = start
+    for lo, hi in pieces:
+        output[position:position + hi - lo] = data[lo:hi]
+        position += hi - lo
+    output[start:position].sort(kind="stable")
+
+
+def parallel_merge_sort(values, workers=None):
+    """
+    Parallel Merge Sort over a process pool (stable):
+    1. the input is copied into a shared memory segment and split into
+       `workers` parts, each sorted by its own process,
+    2. splitters sampled from the sorted runs cut every run into `workers`
+       value ranges (binary search), so the k-way merge of each range is
+       independent and is done in parallel, straight into a shared output buffer.
+
+    With workers=1 the same pipeline runs with a single process, which is the
+    T(1) of the strong-scaling benchmark.
+
+    Args:
+        values: Numeric array-like (converted with np.asarray)
+        workers (int): Number of processes, all CPUs by default
+
+    Returns:
+        np.ndarray: Sorted copy of the values
     """
-    Generates data and runs timeit comparisons for different array sizes.
+    values = np.asarray(values)
+    size = len(values)
+    workers = workers or os.cpu_count()
+
+    if size < 2 * workers:
+        # Too small to split - not worth starting processes
+        result = values.copy()
+        result.sort(kind="stable")
+        return result
+
+    input_memory = SharedMemory(create=True, size=values.nbytes)
+    output_memory = SharedMemory(create=True, size=values.nbytes)
+    try:
+        data = np.ndarray(size, dtype=values.dtype, buffer=input_memory.buf)
+        output = np.ndarray(size, dtype=values.dtype, buffer=output_memory.buf)
+        data[:] = values
+
+        edges = np.linspace(0, size, workers + 1).astype(np.int64)
+        segments = list(zip(edges[:-1].tolist(), edges[1:].tolist()))
+
+        with Pool(workers, initializer=_attach_shared,
+                  initargs=(input_memory, output_memory, values.dtype, size)) as pool:
+            pool.map(_sort_segment, segments)
+
+            # Regular sampling: a few evenly spaced elements of every sorted run
+            samples = np.sort(np.concatenate([
+                data[lo:hi][np.linspace(0, hi - lo - 1, workers * 4).astype(np.int64)]
+                for lo, hi in segments]))
+            splitters = samples[np.arange(1, workers) * len(samples) // workers]
+
+            # cuts[r][p] - where partition p starts inside run r
+            cuts = [np.concatenate(([0], np.searchsorted(data[lo:hi], splitters, side="left"),
+                                    [hi - lo])).tolist() for lo, hi in segments]
+
+            tasks = []
+            start = 0
+            for part in range(workers):
+                pieces = [(lo + cut[part], lo + cut[part + 1])
+                          for (lo, _), cut in zip(segments, cuts)]
+                tasks.append((start, pieces))
+                start += sum(hi - lo for lo, hi in pieces)
+            pool.map(_merge_partition, tasks)
+
+        result = output.copy()
+        del data, output
+    finally:
+        input_memory.close()
+        input_memory.unlink()
+        output_memory.close()
+        output_memory.unlink()
+
+    return result
+
+
+# ------------------------------------------
+# Benchmark suite
+# ------------------------------------------
+
+# In-place sorting functions under test
+ALGORITHMS = {
+    "Insertion Sort": insertion_sort,
+    "Merge Sort": merge_sort,
+    "Bottom-up Merge Sort": merge_sort_bottom_up,
+    "Hybrid Sort": hybrid_sort,
+    "Counting Sort": _sort_in_place(counting_sort),
+    "Radix Sort (LSD)": _sort_in_place(radix_sort),
+    "Built-in (Timsort)": list.sort,
+}
+
+# O(n^2) algorithms are skipped above --max-quadratic elements
+QUADRATIC = {"Insertion Sort"}
+
+# Algorithms that sort only non-negative integers (no comparisons to count)
+INTEGER_ONLY = {"Counting Sort", "Radix Sort (LSD)"}
+
+
+def gen_random(size, rng):
+    return [rng.randint(0, 100000) for _ in range(size)]
+
+def gen_sorted(size, rng):
+    return sorted(gen_random(size, rng))
+
+def gen_reversed(size, rng):
+    return sorted(gen_random(size, rng), reverse=True)
+
+def gen_nearly_sorted(size, rng):
+    """Sorted data with ~1% of the elements swapped with a random partner."""
+    data = gen_sorted(size, rng)
+    for _ in range(max(1, size // 100)):
+        i, j = rng.randrange(size), rng.randrange(size)
+        data[i], data[j] = data[j], data[i]
+    return data
+
+def gen_few_unique(size, rng):
+    return [rng.randint(0, 9) for _ in range(size)]
+
+def gen_sawtooth(size, rng):
+    """Ascending runs of about sqrt(size) elements each."""
+    period = max(2, int(size ** 0.5))
+    return [i % period for i in range(size)]
+
+def gen_strings(size, rng):
+    return ["".join(rng.choices(string.ascii_lowercase, k=10)) for _ in range(size)]
+
+def gen_tuples(size, rng):
+    # Few distinct first fields, so the comparisons often look at the second one
+    return [(rng.randint(0, 100), rng.randint(0, 100000)) for _ in range(size)]
+
+
+DISTRIBUTIONS = {
+    "random": gen_random,
+    "sorted": gen_sorted,
+    "reversed": gen_reversed,
+    "nearly_sorted": gen_nearly_sorted,
+    "few_unique": gen_few_unique,
+    "sawtooth": gen_sawtooth,
+    "strings": gen_strings,
+    "tuples": gen_tuples,
+}
+
+INTEGER_DISTRIBUTIONS = {"random", "sorted", "reversed", "nearly_sorted", "few_unique", "sawtooth"}
+
+
+class Counted:
+    """
+    Wrapper that counts every comparison (< and ==) made by a sorting or
+    merging algorithm. Also used by the merge benchmarks in 02_merge_k_lists.py
+    and algo-hw-08, where tuple/list keys compare their items with == first.
+    """
+    __slots__ = ("value",)
+    comparisons = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        Counted.comparisons += 1
+        return self.value < other.value
+
+    def __eq__(self, other):
+        Counted.comparisons += 1
+        return self.value == other.value
+
+
+def count_comparisons(sort_func, data) -> int:
+    """Runs the sort once on wrapped elements and returns the number of comparisons."""
+    wrapped = [Counted(value) for value in data]
+    Counted.comparisons = 0
+    sort_func(wrapped)
+    return Counted.comparisons
+
+
+def percentile(sorted_values: list, p: float) -> float:
+    """
+    Returns the p-th percentile (0-100) of an already sorted list
+    using the nearest-rank method.
     """
-    # Define test sizes: Small, Medium, Large
-    sizes = [100, 1000, 10000]
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * p // 100))  # ceil without floats
+    return sorted_values[int(rank) - 1]
 
-    print(f"{'Algorithm':<20} | {'Array Size':<10} | {'Time (seconds)':<15}")
-    print("-" * 55)
 
+def time_sort(sort_func, data, repeat: int, warmup: int) -> list:
+    """
+    Times the sort `repeat` times after `warmup` untimed runs.
+    Every run sorts a fresh copy; the copy is made outside the timed region.
+
+    Returns:
+        list: Sorted run times in seconds
+    """
+    times = []
+    for run in range(warmup + repeat):
+        work = data.copy()
+        started_at = time.perf_counter()
+        sort_func(work)
+        elapsed = time.perf_counter() - started_at
+        if run >= warmup:
+            times.append(elapsed)
+    return sorted(times)
+
+
+def run_suite(sizes, distributions, algorithms, repeat: int = 5, warmup: int = 1,
+              comparisons: bool = False, max_quadratic: int = 10000, seed: int = 42) -> list:
+    """
+    Runs every algorithm on every distribution and size and prints a table.
+
+    Returns:
+        list: One dict per measurement (algorithm, distribution, size, runs,
+              min, median, p95 and optionally comparisons)
+    """
+    print(f"{'Algorithm':<20} | {'Distribution':<13} | {'Size':<9} | {'Min (s)':<10} | "
+          f"{'Median (s)':<10} | {'p95 (s)':<10} | {'Comparisons':<12}")
+    print("-" * 102)
+
+    results = []
     for size in sizes:
-        # Generate random data for this size
-        original_data = [random.randint(0, 100000) for _ in range(size)]
+        for distribution in distributions:
+            # Same input for every algorithm, reproducible across runs
+            data = DISTRIBUTIONS[distribution](size, random.Random(f"{seed}-{distribution}-{size}"))
+            expected = sorted(data)
 
-        # --- Test 1: Insertion Sort ---
-        # We perform a copy of data inside the lambda to ensure fair testing on unsorted data
-        test_data = original_data[:]
-        time_insertion = timeit.timeit(lambda: insertion_sort(test_data.copy()), number=1)
-        print(f"{'Insertion Sort':<20} | {size:<10} | {time_insertion:.6f}")
+            for name in algorithms:
+                if name in QUADRATIC and size > max_quadratic:
+                    continue
+                if name in INTEGER_ONLY and distribution not in INTEGER_DISTRIBUTIONS:
+                    continue
+                counts_comparisons = comparisons and name not in INTEGER_ONLY
+                sort_func = ALGORITHMS[name]
 
-        # --- Test 2: Merge Sort ---
-        test_data = original_data[:]
-        time_merge = timeit.timeit(lambda: merge_sort(test_data.copy()), number=1)
-        print(f"{'Merge Sort':<20} | {size:<10} | {time_merge:.6f}")
+                check = data.copy()
+                sort_func(check)
+                if check != expected:
+                    raise AssertionError(f"{name} returned a wrong result on {distribution}/{size}")
 
-        # --- Test 3: Python Built-in Sort (Timsort) ---
-        test_data = original_data[:]
-        time_builtin = timeit.timeit(lambda: test_data.copy().sort(), number=1)
-        print(f"{'Built-in (Timsort)':<20} | {size:<10} | {time_builtin:.6f}")
+                times = time_sort(sort_func, data, repeat, warmup)
+                result = {
+                    "algorithm": name,
+                    "distribution": distribution,
+                    "size": size,
+                    "runs": repeat,
+                    "min": times[0],
+                    "median": statistics.median(times),
+                    "p95": percentile(times, 95),
+                    "comparisons": count_comparisons(sort_func, data) if counts_comparisons else None,
+                }
+                results.append(result)
 
-        print("-" * 55)
+                counted = result["comparisons"] if counts_comparisons else "-"
+                print(f"{name:<20} | {distribution:<13} | {size:<9} | {result['min']:<10.6f} | "
+                      f"{result['median']:<10.6f} | {result['p95']:<10.6f} | {counted:<12}")
+        print("-" * 102)
 
+    return results
+
+
+def save_results(results: list, path: str) -> None:
+    """Writes the results as JSON or CSV, depending on the file extension."""
+    if path.endswith(".csv"):
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(results[0]))
+            writer.writeheader()
+            writer.writerows(results)
+    else:
+        with open(path, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+def load_results(path: str) -> list:
+    """Reads results saved by save_results()."""
+    if path.endswith(".csv"):
+        with open(path, newline="") as f:
+            return [{**row, "size": int(row["size"]), "median": float(row["median"])}
+                    for row in csv.DictReader(f)]
+    with open(path) as f:
+        return json.load(f)
+
+
+def check_regression(results: list, baseline: list, tolerance: float) -> list:
+    """
+    Compares median times with a saved baseline.
+
+    Args:
+        results (list): Current results
+        baseline (list): Results of an earlier run
+        tolerance (float): Allowed slowdown, e.g. 0.1 for +10%
+
+    Returns:
+        list: (algorithm, distribution, size, baseline median, current median) of every regression
+    """
+    previous = {(r["algorithm"], r["distribution"], r["size"]): r["median"] for r in baseline}
+
+    regressions = []
+    for result in results:
+        key = (result["algorithm"], result["distribution"], result["size"])
+        if key in previous and result["median"] > previous[key] * (1 + tolerance):
+            regressions.append((*key, previous[key], result["median"]))
+    return regressions
+
+
+def run_memory_benchmark(size: int = 10 ** 6, seed: int = 42) -> None:
+    """Compares peak extra memory (tracemalloc) and time of the two merge sorts."""
+    data = gen_random(size, random.Random(seed))
+
+    print(f"{'Algorithm':<22} | {'Size':<9} | {'Time (s)':<10} | {'Peak memory (MB)':<16}")
+    print("-" * 66)
+    for name in ("Merge Sort", "Bottom-up Merge Sort"):
+        sort_func = ALGORITHMS[name]
+
+        # Time without tracing - tracemalloc slows allocations down considerably
+        elapsed = time_sort(sort_func, data, repeat=1, warmup=0)[0]
+
+        work = data.copy()
+        tracemalloc.start()
+        sort_func(work)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"{name:<22} | {size:<9} | {elapsed:<10.3f} | {peak / 1024 / 1024:<16.1f}")
+
+
+def _measure(sort_func, data) -> tuple:
+    """Returns (seconds, peak traced memory in bytes) of the sort."""
+    # Timed without tracing - tracemalloc slows Python allocations down considerably
+    started_at = time.perf_counter()
+    result = sort_func(data)
+    elapsed = time.perf_counter() - started_at
+    del result
+
+    tracemalloc.start()
+    result = sort_func(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, peak
+
+
+def run_integer_benchmark(sizes, list_limit: int = 10 ** 6, seed: int = 42) -> None:
+    """
+    Compares the integer sorts with comparison sorts on bounded ints (0..100000)
+    stored in array('I') and NumPy uint32 buffers. Pure Python containers are
+    measured only up to `list_limit` elements. Memory is the input buffer size
+    and the peak of the extra memory the sort allocates (tracemalloc; NumPy
+    reports its buffers to tracemalloc too).
+    """
+    rng = np.random.default_rng(seed)
+
+    print(f"{'Algorithm':<20} | {'Container':<10} | {'Size':<10} | {'Time (s)':<10} | "
+          f"{'Input (MB)':<10} | {'Peak extra (MB)':<15}")
+    print("-" * 90)
+    for size in sizes:
+        numbers = rng.integers(0, 100001, size, dtype=np.uint32)
+        candidates = [
+            ("Counting Sort", "numpy", counting_sort, numbers),
+            ("Radix Sort (LSD)", "numpy", radix_sort, numbers),
+            ("Radix argsort", "numpy", lambda a: radix_sort(a, argsort=True), numbers),
+            ("np.sort (quicksort)", "numpy", np.sort, numbers),
+        ]
+        if size <= list_limit:
+            packed = array("I", numbers.tobytes())
+            candidates += [
+                ("Counting Sort", "array", counting_sort, packed),
+                ("Radix Sort (LSD)", "array", radix_sort, packed),
+                ("Radix argsort", "array", lambda a: radix_sort(a, argsort=True), packed),
+                ("Built-in (Timsort)", "array", sorted, packed),
+            ]
+
+        for name, container, sort_func, data in candidates:
+            input_bytes = data.nbytes if container == "numpy" else len(data) * data.itemsize
+            elapsed, peak = _measure(sort_func, data)
+            print(f"{name:<20} | {container:<10} | {size:<10} | {elapsed:<10.3f} | "
+                  f"{input_bytes / 1024 / 1024:<10.1f} | {peak / 1024 / 1024:<15.1f}")
+        print("-" * 90)
+
+
+def run_scaling_benchmark(size: int = 10 ** 7, max_workers: int = None,
+                          baseline_limit: int = 10 ** 6, seed: int = 42) -> None:
+    """
+    Strong scaling of parallel_merge_sort: the same input sorted with 1..max_workers
+    processes. Speedup and efficiency are relative to the parallel pipeline with
+    one process; the in-process np.sort is printed as a serial reference only.
+    The other baseline is the single-core recursive merge_sort; above
+    `baseline_limit` elements it is measured on a prefix and scaled by n log n.
+    """
+    max_workers = max_workers or os.cpu_count()
+    values = np.random.default_rng(seed).integers(0, 2 ** 31, size, dtype=np.int64)
+
+    measured = min(size, baseline_limit)
+    baseline = time_sort(merge_sort, values[:measured].tolist(), repeat=1, warmup=0)[0]
+    estimated = measured < size
+    if estimated:
+        baseline *= size * math.log2(size) / (measured * math.log2(measured))
+    print(f"merge_sort baseline on {size} elements: {baseline:.3f} s"
+          f"{' (estimated from ' + str(measured) + ' elements)' if estimated else ''}\n")
+
+    print(f"{'Workers':<8} | {'Time (s)':<10} | {'Speedup':<8} | {'Efficiency':<10} | {'vs merge_sort':<13}")
+    print("-" * 61)
+    started_at = time.perf_counter()
+    expected = np.sort(values, kind="stable")
+    serial = time.perf_counter() - started_at
+    print(f"{'np.sort':<8} | {serial:<10.3f} | {'-':<8} | {'-':<10} | {baseline / serial:<13.1f}")
+
+    single = None
+    for workers in range(1, max_workers + 1):
+        started_at = time.perf_counter()
+        result = parallel_merge_sort(values, workers)
+        elapsed = time.perf_counter() - started_at
+        if not np.array_equal(result, expected):
+            raise AssertionError(f"parallel_merge_sort returned a wrong result with {workers} workers")
+
+        single = single or elapsed
+        speedup = single / elapsed
+        print(f"{workers:<8} | {elapsed:<10.3f} | {speedup:<8.2f} | {speedup / workers:<10.0%} | "
+              f"{baseline / elapsed:<13.1f}")
+
+
+def tune_hybrid_threshold(size: int = 100000, seed: int = 42) -> None:
+    """Times hybrid_sort on random data for several min_merge thresholds."""
+    data = gen_random(size, random.Random(seed))
+
+    print(f"{'min_merge':<10} | {'Size':<9} | {'Median (s)':<10}")
+    print("-" * 35)
+    for threshold in (8, 16, 32, 64, 128, 256):
+        times = time_sort(lambda arr: hybrid_sort(arr, threshold), data, repeat=3, warmup=1)
+        print(f"{threshold:<10} | {size:<9} | {statistics.median(times):<10.6f}")
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Sorting algorithms benchmark suite")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000],
+                        help="Array sizes")
+    parser.add_argument("--distributions", nargs="+", default=["random"],
+                        choices=list(DISTRIBUTIONS) + ["all"], help="Input distributions")
+    parser.add_argument("--algorithms", nargs="+", default=list(ALGORITHMS),
+                        choices=list(ALGORITHMS), metavar="NAME",
+                        help=f"Algorithms to run: {', '.join(ALGORITHMS)}")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Timed runs per measurement")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed runs before measuring")
+    parser.add_argument("--comparisons", action="store_true", help="Also count the comparisons")
+    parser.add_argument("--max-quadratic", type=int, default=10000,
+                        help="Largest size for O(n^2) algorithms")
+    parser.add_argument("--seed", type=int, default=42, help="Seed of the input generators")
+    parser.add_argument("-o", "--output", help="Save the results to a .json or .csv file")
+    parser.add_argument("--baseline", help="Fail if medians are slower than in this results file")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="Allowed slowdown against the baseline (default 0.10 = 10%%)")
+    parser.add_argument("--bench-memory", type=int, nargs="?", const=10 ** 6, metavar="SIZE",
+                        help="Compare peak memory of the recursive and bottom-up merge sorts")
+    parser.add_argument("--bench-int", type=int, nargs="*", metavar="SIZE",
+                        help="Benchmark the integer sorts on array/NumPy buffers "
+                             "(default sizes 10^5..10^7, up to 10^8 needs ~3 GB RAM)")
+    parser.add_argument("--bench-parallel", type=int, nargs="?", const=10 ** 7, metavar="SIZE",
+                        help="Strong-scaling benchmark of the parallel merge sort")
+    parser.add_argument("-w", "--workers", type=int, help="Max number of processes (all CPUs by default)")
+    parser.add_argument("--tune-hybrid", type=int, nargs="?", const=100000, metavar="SIZE",
+                        help="Time the Hybrid Sort with different insertion sort thresholds")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_arguments()
+    distributions = list(DISTRIBUTIONS) if "all" in args.distributions else args.distributions
+
+    if args.bench_memory:
+        run_memory_benchmark(args.bench_memory, args.seed)
+        return
+
+    if args.bench_int is not None:
+        run_integer_benchmark(args.bench_int or [10 ** 5, 10 ** 6, 10 ** 7], seed=args.seed)
+        return
+
+    if args.bench_parallel:
+        run_scaling_benchmark(args.bench_parallel, args.workers, seed=args.seed)
+        return
+
+    if args.tune_hybrid:
+        tune_hybrid_threshold(args.tune_hybrid, args.seed)
+        return
 
-if __name__ == "__main__":
     print("Starting Benchmark...\n")
-    run_benchmark()
-    print("\nBenchmark finished.")
\ No newline at end of file
+    results = run_suite(args.sizes, distributions, args.algorithms, args.repeat, args.warmup,
+                        args.comparisons, args.max_quadratic, args.seed)
+    print("\nBenchmark finished.")
+
+    if args.output:
+        save_results(results, args.output)
+        print(f"Results saved to {args.output}")
+
+    if args.baseline:
+        regressions = check_regression(results, load_results(args.baseline), args.tolerance)
+        for name, distribution, size, before, after in regressions:
+            print(f"REGRESSION: {name} on {distribution}/{size}: "
+                  f"{before:.6f} s -> {after:.6f} s ({after / before - 1:+.0%})")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,13 @@
-def merge_two_lists(list1, list2):
+import argparse
+import bisect
+import random
+import time
+
+
+def merge_two_lists_linear(list1, list2):
     """
     Helper function to merge two sorted lists into one sorted list.
+    Compares one element at a time (kept as the baseline for the benchmark).
     """
     merged = []
     i, j = 0, 0
@@ -24,30 +31,133 @@ def merge_two_lists(list1, list2):
 
     return merged
 
+# Wins of one list in a row after which the merge switches to galloping
+MIN_GALLOP = 7
+
+def _gallop(x, lst, lo, hi, right):
+    """
+    Exponential search in sorted lst[lo:hi] starting from lo: probes lo, lo+1,
+    lo+3, lo+7, ... and then binary-searches the bracket. Costs O(log d)
+    comparisons where d is the distance of the answer from lo.
+
+    Returns:
+        int: End of the run starting at lo: first index with lst[index] > x
+             (right=True) or lst[index] >= x (right=False)
+    """
+    last, offset = lo, 1
+    while lo + offset - 1 < hi:
+        probe = lst[lo + offset - 1]
+        if (x < probe) if right else not (probe < x):
+            break
+        last = lo + offset
+        offset *= 2
+    search = bisect.bisect_right if right else bisect.bisect_left
+    return search(lst, x, last, min(lo + offset - 1, hi))
+
+def merge_two_lists(list1, list2):
+    """
+    Helper function to merge two sorted lists into one sorted list.
+    Galloping merge: after MIN_GALLOP wins of one list in a row it stops
+    comparing one element at a time, finds the whole run that goes before the
+    head of the other list with an exponential search and copies it with a
+    single slice extend. Interleaved lists are merged element by element,
+    while a list of m elements is merged into one of n in O(m log(n / m))
+    comparisons. Stable: on equal elements list1 goes first.
+    """
+    merged = []
+    i, j = 0, 0
+    len1, len2 = len(list1), len(list2)
+    wins1 = wins2 = 0
+
+    while i < len1 and j < len2:
+        if list2[j] < list1[i]:
+            merged.append(list2[j])
+            j += 1
+            wins1, wins2 = 0, wins2 + 1
+            if wins2 >= MIN_GALLOP and j < len2:
+                # Every further element of list2 smaller than the head of list1
+                end = _gallop(list1[i], list2, j, len2, right=False)
+                merged.extend(list2[j:end])
+                j, wins2 = end, 0
+        else:
+            merged.append(list1[i])
+            i += 1
+            wins1, wins2 = wins1 + 1, 0
+            if wins1 >= MIN_GALLOP and i < len1:
+                # Every further element of list1 not greater than the head of list2
+                end = _gallop(list2[j], list1, i, len1, right=True)
+                merged.extend(list1[i:end])
+                i, wins1 = end, 0
+
+    # Append the remaining elements of the list that is not exhausted
+    merged.extend(list1[i:])
+    merged.extend(list2[j:])
+
+    return merged
+
 def merge_k_lists(lists):
     """
     Merges k sorted lists using the Divide and Conquer approach.
+    Iterative pairwise schedule: every round merges neighbouring pairs of lists,
+    halving their number, so no lists[:mid] copies and no recursion are needed.
     Time Complexity: O(N log k) where N is total elements and k is number of lists.
     """
     # Base case: if the input list of lists is empty
     if not lists:
         return []
 
-    # Base case: if there is only one list, return it
-    if len(lists) == 1:
-        return lists[0]
+    # Merge rounds until one list is left; neighbours keep merges stable
+    while len(lists) > 1:
+        lists = [merge_two_lists(lists[i], lists[i + 1]) if i + 1 < len(lists) else lists[i]
+                 for i in range(0, len(lists), 2)]
 
-    # Divide step: find the middle index
-    mid = len(lists) // 2
+    return lists[0]
 
-    # Recursive calls: divide the lists into two halves
-    left_merged = merge_k_lists(lists[:mid])
-    right_merged = merge_k_lists(lists[mid:])
+class Counted:
+    """Wrapper that counts the comparisons (< and ==) made by a merge."""
+    __slots__ = ("value",)
+    comparisons = 0
 
-    # Conquer step: merge the two sorted results
-    return merge_two_lists(left_merged, right_merged)
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        Counted.comparisons += 1
+        return self.value < other.value
+
+    def __eq__(self, other):
+        Counted.comparisons += 1
+        return self.value == other.value
+
+def run_benchmark(seed: int = 42) -> None:
+    """Compares the linear and the galloping merge on balanced and skewed list sizes."""
+    rng = random.Random(seed)
+
+    print(f"{'Merge':<10} | {'m':<6} | {'n':<9} | {'Time (s)':<10} | {'Comparisons':<12}")
+    print("-" * 57)
+    for m, n in ((10, 10 ** 6), (1000, 10 ** 6), (10 ** 5, 10 ** 5)):
+        small = sorted(rng.randint(0, 10 ** 9) for _ in range(m))
+        large = sorted(rng.randint(0, 10 ** 9) for _ in range(n))
+
+        for name, merge in (("Linear", merge_two_lists_linear), ("Galloping", merge_two_lists)):
+            started_at = time.perf_counter()
+            merge(small, large)
+            elapsed = time.perf_counter() - started_at
+
+            Counted.comparisons = 0
+            merge([Counted(v) for v in small], [Counted(v) for v in large])
+            print(f"{name:<10} | {m:<6} | {n:<9} | {elapsed:<10.6f} | {Counted.comparisons:<12}")
+        print("-" * 57)
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Merge k sorted lists")
+    parser.add_argument("--bench", action="store_true", help="Compare the linear and galloping merges")
+    args = parser.parse_args()
+
+    if args.bench:
+        run_benchmark()
+        return
+
     lists = [[1, 4, 5], [1, 3, 4], [2, 6]]
     result = merge_k_lists(lists)
     print("Sorted list: ", result)
@@ -0,0 +1,323 @@
+import argparse
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+MB = 1024 * 1024
+
+# Smallest block a run may get in the merge: below that every round moves only a
+# handful of records and the merge degrades into one tiny read per record.
+MIN_BLOCK_RECORDS = 16
+
+# Records are read and written with np.fromfile/tofile in whole blocks, which go
+# straight to the file descriptor - the blocks themselves are the I/O buffers and
+# a Python-level file buffer would only add a copy and memory outside the budget.
+
+
+# ------------------------------------------
+# K-way merge of sorted arrays
+# ------------------------------------------
+
+def merge_two_arrays(array1, array2):
+    """
+    Merges two sorted NumPy arrays into one sorted array.
+    The stable sort of the concatenation is Timsort for these dtypes: it finds
+    the two runs and merges them in O(n).
+    """
+    merged = np.concatenate((array1, array2))
+    merged.sort(kind="stable")
+    return merged
+
+
+def merge_k_arrays(arrays):
+    """
+    Merges k sorted arrays using the Divide and Conquer approach
+    (the same scheme as merge_k_lists in 02_merge_k_lists.py).
+    Time Complexity: O(N log k) where N is total elements and k is number of arrays.
+    """
+    if not arrays:
+        return np.empty(0)
+    if len(arrays) == 1:
+        return arrays[0]
+
+    mid = len(arrays) // 2
+    return merge_two_arrays(merge_k_arrays(arrays[:mid]), merge_k_arrays(arrays[mid:]))
+
+
+# ------------------------------------------
+# Sorted runs
+# ------------------------------------------
+
+class RunReader:
+    """Reads a sorted run file in blocks of `block_records` records."""
+
+    def __init__(self, path: str, dtype, block_records: int):
+        self.file = open(path, "rb")
+        self.dtype = dtype
+        self.block_records = block_records
+        self.block = np.empty(0, dtype=dtype)
+        self.refill()
+
+    def refill(self) -> None:
+        """Loads the next block. An empty block means the run is exhausted."""
+        self.block = np.fromfile(self.file, dtype=self.dtype, count=self.block_records)
+        if not len(self.block):
+            self.file.close()
+
+
+def write_runs(input_path: str, spill_dir: str, dtype, chunk_records: int) -> list:
+    """
+    Phase 1: reads the input in chunks that fit in memory, sorts each chunk
+    in place (introsort, no extra buffer) and writes it to its own spill file.
+
+    Returns:
+        list: Paths of the sorted runs
+    """
+    runs = []
+    with open(input_path, "rb") as f:
+        while True:
+            chunk = np.fromfile(f, dtype=dtype, count=chunk_records)
+            if not len(chunk):
+                break
+            chunk.sort()
+
+            path = os.path.join(spill_dir, f"run-0-{len(runs):06d}.bin")
+            with open(path, "wb") as out:
+                chunk.tofile(out)
+            runs.append(path)
+            del chunk
+    return runs
+
+
+def merge_runs(paths: list, output_path: str, dtype, memory_budget: int) -> None:
+    """
+    Streams the k-way merge of sorted run files into output_path.
+
+    Every run keeps one block in memory. In each round all records not greater
+    than the smallest block tail are final: they are cut off every block
+    (binary search), merged with merge_k_arrays() and written out. The run whose
+    block ended at that tail is refilled, so each round makes progress.
+    Float NaNs are ordered last, as np.sort() does.
+
+    Memory: with B bytes of blocks in total, a round holds up to B of old blocks
+    (the prefixes still point into them), B of refilled blocks and about 2.5 B
+    in merge_k_arrays() (both halves, their concatenation and the Timsort buffer),
+    so the blocks get a fifth of the budget.
+    """
+    itemsize = np.dtype(dtype).itemsize
+    block_records = max(1, memory_budget // 5 // len(paths) // itemsize)
+    readers = [reader for reader in (RunReader(path, dtype, block_records) for path in paths)
+               if len(reader.block)]
+
+    with open(output_path, "wb") as out:
+        while readers:
+            # fmin skips NaN tails (min() would return NaN if one came first)
+            bound = np.fmin.reduce(np.array([reader.block[-1] for reader in readers]))
+
+            prefixes = []
+            for reader in readers:
+                cut = np.searchsorted(reader.block, bound, side="right")
+                prefixes.append(reader.block[:cut])
+                reader.block = reader.block[cut:]
+                if not len(reader.block):
+                    reader.refill()
+
+            merge_k_arrays(prefixes).tofile(out)
+            readers = [reader for reader in readers if len(reader.block)]
+
+
+def check_memory_budget(memory_budget: int, fan_in: int, dtype) -> None:
+    """
+    Raises ValueError if fan_in is below 2 or memory_budget cannot give every
+    one of fan_in runs a block of at least MIN_BLOCK_RECORDS records (merge_runs()
+    splits a fifth of the budget between the blocks).
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+
+    itemsize = np.dtype(dtype).itemsize
+    required = 5 * fan_in * MIN_BLOCK_RECORDS * itemsize
+    if memory_budget < required:
+        raise ValueError(f"memory_budget of {memory_budget} bytes is too small for fan_in {fan_in}: "
+                         f"at least {required} bytes are needed for {MIN_BLOCK_RECORDS} records per block")
+
+
+def external_sort(input_path: str, output_path: str, dtype="<u8",
+                  memory_budget: int = 512 * MB, fan_in: int = 64, tmp_dir: str = None) -> dict:
+    """
+    External Merge Sort of a binary file of fixed-width records (NumPy dtype)
+    that may be much larger than RAM.
+
+    1. Run generation: chunks of memory_budget bytes are sorted into spill files.
+    2. Merge passes: groups of `fan_in` runs are merged into longer runs until
+       at most `fan_in` are left; the final pass streams into output_path.
+
+    Args:
+        input_path (str): Input file of records
+        output_path (str): Sorted output file
+        dtype: NumPy dtype of a record, e.g. "<u8", "<i4", "<f8"
+        memory_budget (int): Max bytes of record buffers held in memory (see check_memory_budget())
+        fan_in (int): Max number of runs merged at once
+        tmp_dir (str): Where to create the spill folder (default: next to the output)
+
+    Returns:
+        dict: Number of runs, merge passes and the time of each phase
+    """
+    check_memory_budget(memory_budget, fan_in, dtype)
+
+    dtype = np.dtype(dtype)
+    chunk_records = memory_budget // dtype.itemsize
+    spill_dir = tempfile.mkdtemp(prefix="external-sort-",
+                                 dir=tmp_dir or os.path.dirname(os.path.abspath(output_path)))
+    stats = {"runs": 0, "passes": 0, "run_time": 0.0, "merge_time": 0.0}
+    try:
+        started_at = time.perf_counter()
+        runs = write_runs(input_path, spill_dir, dtype, chunk_records)
+        stats["runs"] = len(runs)
+        stats["run_time"] = time.perf_counter() - started_at
+
+        started_at = time.perf_counter()
+        while len(runs) > fan_in:
+            # Intermediate pass: every group of fan_in runs becomes one longer run
+            stats["passes"] += 1
+            merged = []
+            for i in range(0, len(runs), fan_in):
+                group = runs[i:i + fan_in]
+                path = os.path.join(spill_dir, f"run-{stats['passes']}-{len(merged):06d}.bin")
+                merge_runs(group, path, dtype, memory_budget)
+                for run in group:
+                    os.remove(run)
+                merged.append(path)
+            runs = merged
+
+        stats["passes"] += 1
+        if runs:
+            merge_runs(runs, output_path, dtype, memory_budget)
+        else:
+            open(output_path, "wb").close()
+        stats["merge_time"] = time.perf_counter() - started_at
+    finally:
+        shutil.rmtree(spill_dir, ignore_errors=True)
+
+    return stats
+
+
+# ------------------------------------------
+# Benchmark
+# ------------------------------------------
+
+def generate_records(path: str, size_bytes: int, dtype="<u8", seed: int = 42) -> None:
+    """Writes size_bytes of random records, chunk by chunk."""
+    dtype = np.dtype(dtype)
+    rng = np.random.default_rng(seed)
+    left = size_bytes // dtype.itemsize
+    with open(path, "wb") as f:
+        while left:
+            count = min(left, 16 * MB // dtype.itemsize)
+            if dtype.kind == "f":
+                chunk = rng.random(count).astype(dtype)
+            else:
+                info = np.iinfo(dtype)
+                chunk = rng.integers(info.min, info.max, count, dtype=dtype, endpoint=True)
+            chunk.tofile(f)
+            left -= count
+
+
+def check_sorted(path: str, dtype="<u8", block_records: int = 4 * MB) -> bool:
+    """
+    Streams through the file and checks that the records never decrease
+    in the order of np.sort() (float NaNs last).
+    """
+    previous = np.empty(0, dtype=dtype)
+    with open(path, "rb") as f:
+        while True:
+            block = np.fromfile(f, dtype=dtype, count=block_records)
+            if not len(block):
+                return True
+            # The last record of the previous block goes first, so the border is checked too
+            block = np.concatenate((previous, block))
+            wrong = block[1:] < block[:-1]
+            if block.dtype.kind == "f":
+                wrong |= np.isnan(block[:-1]) & ~np.isnan(block[1:])
+            if np.any(wrong):
+                return False
+            previous = block[-1:]
+
+
+def run_benchmark(size_gb: float, memory_budget: int, fan_in: int, dtype="<u8", tmp_dir: str = None) -> None:
+    """Generates size_gb of random records, sorts them externally and verifies the output."""
+    check_memory_budget(memory_budget, fan_in, dtype)
+
+    work_dir = tempfile.mkdtemp(prefix="external-bench-", dir=tmp_dir)
+    input_path = os.path.join(work_dir, "input.bin")
+    output_path = os.path.join(work_dir, "sorted.bin")
+    size_bytes = int(size_gb * 1024 * MB)
+    try:
+        print(f"Generating {size_gb} GB of {np.dtype(dtype)} records in {work_dir}...")
+        generate_records(input_path, size_bytes, dtype)
+
+        tracemalloc.start()
+        started_at = time.perf_counter()
+        stats = external_sort(input_path, output_path, dtype, memory_budget, fan_in)
+        elapsed = time.perf_counter() - started_at
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        sorted_ok = check_sorted(output_path, dtype)
+        same_size = os.path.getsize(output_path) == os.path.getsize(input_path)
+
+        print(f"\n{'Phase':<16} | {'Time (s)':<10} | {'MB/s':<10}")
+        print("-" * 42)
+        for phase, seconds in (("Run generation", stats["run_time"]),
+                               ("Merge", stats["merge_time"]),
+                               ("Total", elapsed)):
+            print(f"{phase:<16} | {seconds:<10.2f} | {size_bytes / MB / seconds:<10.1f}")
+        print("-" * 42)
+        print(f"Runs: {stats['runs']}, merge passes: {stats['passes']}, fan-in: {fan_in}")
+        print(f"Memory budget: {memory_budget / MB:.0f} MB, peak traced memory: {peak / MB:.1f} MB")
+        print(f"Output sorted: {sorted_ok and same_size}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="External merge sort of binary fixed-width records")
+    parser.add_argument("input", nargs="?", help="Input file of records")
+    parser.add_argument("output", nargs="?", help="Sorted output file")
+    parser.add_argument("-m", "--memory", type=int, default=512, help="Memory budget in MB (default 512)")
+    parser.add_argument("-k", "--fan-in", type=int, default=64, help="Max runs merged at once (default 64)")
+    parser.add_argument("--dtype", default="<u8", help="NumPy dtype of a record (default <u8)")
+    parser.add_argument("--tmp-dir", help="Folder for the spill files")
+    parser.add_argument("--bench", type=float, nargs="?", const=10, metavar="GB",
+                        help="Sort GB (default 10) of generated records and verify the result")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_arguments()
+
+    try:
+        check_memory_budget(args.memory * MB, args.fan_in, args.dtype)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+
+    if args.bench:
+        run_benchmark(args.bench, args.memory * MB, args.fan_in, args.dtype, args.tmp_dir)
+        return
+
+    if not args.input or not args.output:
+        print("Both input and output files are required (or use --bench)")
+        return
+
+    stats = external_sort(args.input, args.output, args.dtype, args.memory * MB, args.fan_in, args.tmp_dir)
+    print(f"Sorted {args.input} -> {args.output}: {stats['runs']} runs, {stats['passes']} merge passes, "
+          f"{stats['run_time'] + stats['merge_time']:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
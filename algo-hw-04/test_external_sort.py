@@ -0,0 +1,26 @@
+import numpy as np
+
+from external_sort import check_sorted, external_sort
+
+
+def test_float_records_with_nan_match_np_sort(tmp_path):
+    rng = np.random.default_rng(7)
+    records = rng.random(20000)
+    records[rng.choice(len(records), 500, replace=False)] = np.nan
+    input_path, output_path = tmp_path / "input.bin", tmp_path / "sorted.bin"
+    records.tofile(input_path)
+
+    # A small budget gives many runs, several merge passes and many merge rounds
+    stats = external_sort(input_path, output_path, "<f8", memory_budget=16 * 1024, fan_in=4)
+
+    result = np.fromfile(output_path, dtype="<f8")
+    assert stats["passes"] > 1
+    np.testing.assert_array_equal(result, np.sort(records))
+    assert check_sorted(output_path, "<f8")
+
+
+def test_check_sorted_rejects_nan_before_numbers(tmp_path):
+    path = tmp_path / "records.bin"
+    np.array([1.0, np.nan, 2.0]).tofile(path)
+    assert not check_sorted(path, "<f8")
+    assert not check_sorted(path, "<f8", block_records=1)
@@ -1,4 +1,10 @@
+import argparse
 import heapq
+import importlib.util
+import os
+import random
+import sys
+import time
 
 
 def merge_k_lists(lists):
@@ -31,10 +37,252 @@ def merge_k_lists(lists):
     return merged_list
 
 
+class _Reversed:
+    """Key wrapper with inverted ordering, turns the min-heap into a max-heap."""
+    __slots__ = ("key",)
+
+    def __init__(self, key):
+        self.key = key
+
+    def __lt__(self, other):
+        return other.key < self.key
+
+    def __eq__(self, other):
+        # Heap entries are lists, which look for the first unequal item with ==
+        return self.key == other.key
+
+
+def iter_merge_k(iterables, key=None, reverse=False):
+    """
+    Lazily merges k sorted iterables (lists, generators, files, sockets, cursors).
+
+    Only one head element per source is kept in the heap and every merged
+    element is yielded as soon as it is known, so memory does not depend
+    on the length of the sources. Equal elements keep the order of the
+    sources they came from (stable).
+
+    Args:
+        iterables: Sources, each sorted by `key` (descending if reverse=True)
+        key: Function extracting the comparison key from an element
+        reverse (bool): The sources are sorted in descending order
+
+    Yields:
+        The merged elements
+    """
+    def heap_key(value):
+        k = value if key is None else key(value)
+        return _Reversed(k) if reverse else k
+
+    # Heap entries are [key, source index, value, next function]; the source
+    # index breaks ties, so values themselves are never compared.
+    min_heap = []
+    for i, iterable in enumerate(iterables):
+        next_value = iter(iterable).__next__
+        try:
+            value = next_value()
+        except StopIteration:
+            continue
+        min_heap.append([heap_key(value), i, value, next_value])
+    heapq.heapify(min_heap)
+
+    while len(min_heap) > 1:
+        entry = min_heap[0]
+        yield entry[2]
+        try:
+            value = entry[3]()
+        except StopIteration:
+            heapq.heappop(min_heap)
+            continue
+        # Reuse the entry instead of allocating a new one for every element
+        entry[0], entry[2] = heap_key(value), value
+        heapq.heapreplace(min_heap, entry)
+
+    # A single source left - pass it through without heap operations
+    if min_heap:
+        _, _, value, next_value = min_heap[0]
+        yield value
+        while True:
+            try:
+                yield next_value()
+            except StopIteration:
+                return
+
+
+# Head of an exhausted list - loses every match (checked by identity, never compared)
+_EXHAUSTED = object()
+
+
+def merge_k_lists_loser_tree(lists):
+    """
+    Merges k sorted lists using a Loser Tree (tournament tree).
+
+    Internal node n (1..k-1) stores the loser of the match played there,
+    the leaf of list i is node k + i and tree[0] holds the overall winner.
+    After the winner's element is taken, only its path to the root is replayed:
+    exactly one comparison per level, about log2(k) per element (a heap pop
+    with push needs up to twice as many), and no tuples are created.
+    Exhausted lists get a sentinel head that loses every match.
+    Equal elements are taken from the list with the
+    smaller index first (stable).
+    Time Complexity: O(N log k) where N is total elements and k is number of lists.
+    """
+    k = len(lists)
+    if k == 0:
+        return []
+    if k == 1:
+        return list(lists[0])
+
+    heads = [lst[0] if lst else _EXHAUSTED for lst in lists]
+    positions = [0] * k
+
+    # Initial tournament, bottom-up; winners[n] is the winner of the subtree of node n
+    tree = [0] * k
+    winners = [0] * k + list(range(k))
+    for node in range(k - 1, 0, -1):
+        left, right = winners[2 * node], winners[2 * node + 1]
+        # For k not a power of two the subtrees are not in list order,
+        # so ties are decided by the list indices
+        head_left, head_right = heads[left], heads[right]
+        if head_right is not _EXHAUSTED and (
+                head_left is _EXHAUSTED
+                or ((head_right < head_left) if left < right else not head_left < head_right)):
+            left, right = right, left
+        winners[node], tree[node] = left, right
+    winner = winners[1]
+
+    merged_list = []
+    append = merged_list.append
+    for _ in range(sum(len(lst) for lst in lists)):
+        append(heads[winner])
+
+        source = lists[winner]
+        position = positions[winner] + 1
+        positions[winner] = position
+        value = source[position] if position < len(source) else _EXHAUSTED
+        heads[winner] = value
+
+        # Replay the path to the root against the stored losers
+        node = (winner + k) >> 1
+        while node:
+            loser = tree[node]
+            challenger = heads[loser]
+            if challenger is not _EXHAUSTED and (
+                    value is _EXHAUSTED
+                    or ((not value < challenger) if loser < winner else challenger < value)):
+                tree[node], winner = winner, loser
+                value = challenger
+            node >>= 1
+
+    return merged_list
+
+
+def iter_lines(path: str):
+    """
+    Yields the lines of a file. The file is opened on the first request and
+    closed as soon as it is exhausted, so merging many files does not keep
+    descriptors of the finished ones open.
+    Undecodable bytes are kept as surrogates (and line endings as they are),
+    so writing the lines back with surrogateescape reproduces the input bytes.
+    """
+    with open(path, "r", encoding="utf-8", errors="surrogateescape", newline="") as f:
+        yield from f
+
+
+def _load_divide_and_conquer_merge():
+    """
+    Loads algo-hw-04/02_merge_k_lists.py (not importable by name): its
+    merge_k_lists and the shared Counted comparison counter.
+    """
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        "..", "algo-hw-04", "02_merge_k_lists.py")
+    spec = importlib.util.spec_from_file_location("divide_and_conquer_merge", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_lists(k: int, total: int, shape: str, rng: random.Random) -> list:
+    """
+    Generates k sorted lists with `total` elements in all.
+    shape "uniform" - equal lengths, "skewed" - length of list i proportional to 1 / (i + 1).
+    """
+    if shape == "uniform":
+        weights = [1] * k
+    else:
+        weights = [1 / (i + 1) for i in range(k)]
+    scale = total / sum(weights)
+    return [sorted(rng.randint(0, 10 ** 9) for _ in range(max(1, int(w * scale)))) for w in weights]
+
+
+def run_benchmark(k_values, total: int, comparisons: bool = False, seed: int = 42) -> None:
+    """Times the merge engines for different k and list length distributions."""
+    divide_and_conquer = _load_divide_and_conquer_merge()
+    Counted = divide_and_conquer.Counted
+    engines = {
+        "Divide & Conquer": divide_and_conquer.merge_k_lists,
+        "Heap": merge_k_lists,
+        "Loser Tree": merge_k_lists_loser_tree,
+        "heapq.merge": lambda lists: list(heapq.merge(*lists)),
+    }
+
+    print(f"{'Engine':<18} | {'k':<6} | {'Shape':<8} | {'Elements':<9} | {'Time (s)':<9} | "
+          f"{'Cmp/element':<11}")
+    print("-" * 76)
+    for shape in ("uniform", "skewed"):
+        for k in k_values:
+            lists = make_lists(k, total, shape, random.Random(f"{seed}-{shape}-{k}"))
+            elements = sum(len(lst) for lst in lists)
+            expected = sorted(value for lst in lists for value in lst)
+
+            for name, merge in engines.items():
+                started_at = time.perf_counter()
+                result = merge(lists)
+                elapsed = time.perf_counter() - started_at
+                if result != expected:
+                    raise AssertionError(f"{name} returned a wrong result for k={k}")
+
+                per_element = "-"
+                if comparisons:
+                    wrapped = [[Counted(value) for value in lst] for lst in lists]
+                    Counted.comparisons = 0
+                    merge(wrapped)
+                    per_element = f"{Counted.comparisons / elements:.2f}"
+
+                print(f"{name:<18} | {k:<6} | {shape:<8} | {elements:<9} | {elapsed:<9.4f} | "
+                      f"{per_element:<11}")
+            print("-" * 76)
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Merge k sorted lists or sorted text files")
+    parser.add_argument("files", nargs="*", help="Sorted text files to merge to stdout (e.g. logs)")
+    parser.add_argument("-r", "--reverse", action="store_true", help="The files are sorted descending")
+    parser.add_argument("--bench", action="store_true", help="Benchmark the k-way merge engines")
+    parser.add_argument("-k", type=int, nargs="+", default=[2, 10, 100, 1000, 10000],
+                        help="Numbers of lists for the benchmark")
+    parser.add_argument("--total", type=int, default=200000, help="Total elements for the benchmark")
+    parser.add_argument("--comparisons", action="store_true", help="Also count comparisons per element")
+    return parser.parse_args()
+
+
 def main() -> None:
+    args = parse_arguments()
+
+    if args.bench:
+        run_benchmark(args.k, args.total, args.comparisons)
+        return
+
+    if args.files:
+        sys.stdout.reconfigure(encoding="utf-8", errors="surrogateescape")
+        sys.stdout.writelines(iter_merge_k((iter_lines(path) for path in args.files),
+                                           reverse=args.reverse))
+        return
+
     lists = [[1, 4, 5], [1, 3, 4], [2, 6]]
     merged_list = merge_k_lists(lists)
     print("Sorted list (Heap):", merged_list)
+    print("Sorted list (Lazy):", list(iter_merge_k(iter(lst) for lst in lists)))
+    print("Sorted list (Loser Tree):", merge_k_lists_loser_tree(lists))
 
 
 if __name__ == "__main__":